@@ -7,16 +7,26 @@ Allows AI assistants to interact with Jira issues, projects, and workflows.
 """
 
 import asyncio
+import heapq
+import itertools
 import json
 import logging
 import os
+import re
 import statistics
 import sys
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Sequence
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from dotenv import load_dotenv
-from jira import JIRA
+from jira import JIRA, JIRAError
+from jira.resources import Issue
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
@@ -26,6 +36,14 @@ from mcp.types import (
     ServerCapabilities,
 )
 
+try:
+    import orjson
+except ImportError:  # optional, faster JSON decoding
+    orjson = None
+
+# Use orjson for large JSON payloads when it is installed
+json_loads = orjson.loads if orjson else json.loads
+
 # Load environment variables
 load_dotenv()
 
@@ -34,10 +52,89 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Status categorization for cycle time analysis (case-insensitive matching)
-ACTIVE_STATUSES = {'in progress', 'coding in progress', 'in development', 'in review',
-                   'review', 'code review', 'qa', 'qa in progress', 'testing'}
-DONE_STATUSES = {'closed', 'done', 'resolved', 'verified', 'release pending'}
-BACKLOG_STATUSES = {'new', 'open', 'backlog', 'to do', 'refinement', 'planning'}
+ACTIVE_STATUSES = frozenset({'in progress', 'coding in progress', 'in development', 'in review',
+                             'review', 'code review', 'qa', 'qa in progress', 'testing'})
+DONE_STATUSES = frozenset({'closed', 'done', 'resolved', 'verified', 'release pending'})
+BACKLOG_STATUSES = frozenset({'new', 'open', 'backlog', 'to do', 'refinement', 'planning'})
+
+# Lowercase status name -> category, so categorizing a status is a single lookup
+STATUS_CATEGORIES = {
+    **{status: 'backlog' for status in BACKLOG_STATUSES},
+    **{status: 'active' for status in ACTIVE_STATUSES},
+    **{status: 'done' for status in DONE_STATUSES},
+}
+
+# How long the Jira field catalog is cached before being refetched (seconds)
+FIELDS_CACHE_TTL = 600
+
+# How long fetched issues are reused by the analytics tools (seconds)
+ISSUE_CACHE_TTL = 300
+
+# Maximum number of issue copies kept in the cache; the oldest are dropped first
+ISSUE_CACHE_MAX_ENTRIES = 4096
+
+# How long project metadata (project, issue types, components) is cached (seconds)
+META_CACHE_TTL = 600
+
+# Maximum number of issue keys in a single `key in (...)` JQL search
+JQL_KEY_BATCH_SIZE = 100
+
+# Number of keep-alive connections kept open to the Jira server
+HTTP_POOL_SIZE = 32
+
+# Default page size (override with JIRA_PAGE_SIZE) and number of concurrent
+# page fetches for paginated Jira requests
+PAGE_SIZE = 100
+PAGINATION_WORKERS = 5
+
+# Cap on concurrent page fetches across all tool calls, to stay clear of
+# Jira's rate limits when several paginated requests overlap
+MAX_CONCURRENT_PAGE_FETCHES = 8
+
+# Cap on tool calls running at once. Each one runs on its own worker thread,
+# so the caches they share are guarded by JiraMCPServer._cache_lock
+MAX_CONCURRENT_TOOL_CALLS = 8
+
+# Names (lowercase) the story points field goes by
+STORY_POINTS_FIELD_NAMES = frozenset({'story points', 'story point estimate'})
+
+# Substrings of a field ID or lowercased name that suggest an assigned team field
+ASSIGNED_TEAM_FIELD_TOKENS = ('assignedteam', 'assigned_team', 'assigned team')
+
+# Common custom field IDs, tried when a field cannot be found by name
+SPRINT_FIELD_CANDIDATES = ('customfield_12310940', 'customfield_10020', 'customfield_10010')
+EPIC_LINK_FIELD_CANDIDATES = ('customfield_12311140', 'customfield_10014', 'customfield_10008')
+STORY_POINTS_FIELD_CANDIDATES = ('customfield_10016', 'customfield_10026', 'customfield_10004')
+
+# Extracts the sprint name from the serialized greenhopper Sprint string
+SPRINT_NAME_RE = re.compile(r'name=([^,\]]+)')
+
+# Detail view rendered by get_issue
+ISSUE_TEMPLATE = ("**Issue: {key}**\n\n"
+                  "**Summary:** {summary}\n"
+                  "**Status:** {status}\n"
+                  "**Priority:** {priority}\n"
+                  "**Assignee:** {assignee}\n"
+                  "**Reporter:** {reporter}\n"
+                  "**Type:** {issue_type}\n"
+                  "**Project:** {project}\n"
+                  "**Sprint:** {sprint}\n"
+                  "**Epic Link:** {epic_link}\n"
+                  "{story_points_line}"
+                  "**Security Level:** {security_level}\n"
+                  "**Created:** {created}\n"
+                  "**Updated:** {updated}\n"
+                  "**URL:** {url}\n\n"
+                  "**Description:**\n{description}")
+
+# Date and time parts of a Jira timestamp, e.g. 2026-01-15T10:30:00.000+0000
+JIRA_TIMESTAMP_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2}):(\d{2})')
+
+# Shared by all parallel page fetches; see MAX_CONCURRENT_PAGE_FETCHES
+_PAGE_FETCH_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_PAGE_FETCHES)
+
+# Sentinel for attribute lookups where None is a meaningful value
+_MISSING = object()
 
 # Tools that are always available (analytics-only mode)
 ANALYTICS_TOOLS = {
@@ -45,10 +142,442 @@ ANALYTICS_TOOLS = {
     'get_issue_cycle_time', 'analyze_cycle_time'
 }
 
+# Tool schemas are static, so they are built once at import
+TOOL_DEFINITIONS: List[Tool] = [
+    Tool(
+        name="get_issue",
+        description="Get detailed information about a specific Jira issue",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {
+                    "type": "string",
+                    "description": "The Jira issue key (e.g., PROJ-123)"
+                }
+            },
+            "required": ["issue_key"]
+        }
+    ),
+    Tool(
+        name="get_issues",
+        description="Get detailed information about several Jira issues in one call",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_keys": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "The Jira issue keys (e.g., [\"PROJ-123\", \"PROJ-124\"])"
+                }
+            },
+            "required": ["issue_keys"]
+        }
+    ),
+    Tool(
+        name="search_issues",
+        description="Search for Jira issues using JQL (Jira Query Language)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "jql": {
+                    "type": "string",
+                    "description": "JQL query string (e.g., 'project = PROJ AND status = Open')"
+                },
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum number of results to return",
+                    "default": 50
+                },
+                "batch_size": {
+                    "type": "integer",
+                    "description": "Number of issues fetched per request (default: JIRA_PAGE_SIZE, 100)"
+                }
+            },
+            "required": ["jql"]
+        }
+    ),
+    Tool(
+        name="create_issue",
+        description="Create a new Jira issue",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_key": {
+                    "type": "string",
+                    "description": "Project key (e.g., PROJ)"
+                },
+                "issue_type": {
+                    "type": "string",
+                    "description": "Issue type (e.g., Task, Bug, Story, Epic)"
+                },
+                "summary": {
+                    "type": "string",
+                    "description": "Issue title/summary"
+                },
+                "description": {
+                    "type": "string",
+                    "description": "Issue description"
+                },
+                "priority": {
+                    "type": "string",
+                    "description": "Priority level (e.g., Blocker, Critical, Major, Minor, Normal, Undefined)",
+                    "default": "Normal"
+                },
+                "due_date": {
+                    "type": "string",
+                    "description": "Due date in YYYY-MM-DD format (optional)"
+                },
+                "epic_name": {
+                    "type": "string",
+                    "description": "Epic name (required when issue_type is Epic)"
+                }
+            },
+            "required": ["project_key", "issue_type", "summary", "description"]
+        }
+    ),
+    Tool(
+        name="update_issue",
+        description="Update an existing Jira issue",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {
+                    "type": "string",
+                    "description": "The Jira issue key"
+                },
+                "summary": {
+                    "type": "string",
+                    "description": "New summary (optional)"
+                },
+                "description": {
+                    "type": "string",
+                    "description": "New description (optional)"
+                },
+                "story_points": {
+                    "type": "number",
+                    "description": "Story points estimate (optional)"
+                },
+                "priority": {
+                    "type": "string",
+                    "description": "Priority level (e.g., Blocker, Critical, Major, Minor, Normal, Undefined)"
+                },
+                "assignee": {
+                    "type": "string",
+                    "description": "Assignee email, account ID, or 'me'/'myself' for current user (optional)"
+                },
+                "security_level": {
+                    "type": "string",
+                    "description": "Security level name or ID (optional, e.g., 'Red Hat Employee', 'Team'). Use empty string to remove security level."
+                }
+            },
+            "required": ["issue_key"]
+        }
+    ),
+    Tool(
+        name="add_comment",
+        description="Add a comment to a Jira issue",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {
+                    "type": "string",
+                    "description": "The Jira issue key"
+                },
+                "comment": {
+                    "type": "string",
+                    "description": "Comment text"
+                },
+                "security_level": {
+                    "type": "string",
+                    "description": "Security level name or ID (optional, e.g., 'Employee', 'Internal')"
+                }
+            },
+            "required": ["issue_key", "comment"]
+        }
+    ),
+    Tool(
+        name="get_comments",
+        description="Get all comments for a Jira issue",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {
+                    "type": "string",
+                    "description": "The Jira issue key"
+                }
+            },
+            "required": ["issue_key"]
+        }
+    ),
+    Tool(
+        name="transition_issue",
+        description="Move an issue through workflow states",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {
+                    "type": "string",
+                    "description": "The Jira issue key"
+                },
+                "transition_name": {
+                    "type": "string",
+                    "description": "Name of the transition (e.g., 'In Progress', 'Done')"
+                }
+            },
+            "required": ["issue_key", "transition_name"]
+        }
+    ),
+    Tool(
+        name="get_project",
+        description="Get information about a Jira project",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_key": {
+                    "type": "string",
+                    "description": "Project key"
+                }
+            },
+            "required": ["project_key"]
+        }
+    ),
+    Tool(
+        name="get_issue_types",
+        description="Get available issue types for a project",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_key": {
+                    "type": "string",
+                    "description": "Project key"
+                }
+            },
+            "required": ["project_key"]
+        }
+    ),
+    Tool(
+        name="get_my_issues",
+        description="Get issues assigned to the current user",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum number of results to return",
+                    "default": 20
+                }
+            }
+        }
+    ),
+    Tool(
+        name="get_project_issues",
+        description="Get all issues for a specific project",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_key": {
+                    "type": "string",
+                    "description": "Project key"
+                },
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum number of results to return",
+                    "default": 50
+                },
+                "batch_size": {
+                    "type": "integer",
+                    "description": "Number of issues fetched per request (default: JIRA_PAGE_SIZE, 100)"
+                }
+            },
+            "required": ["project_key"]
+        }
+    ),
+    Tool(
+        name="set_sprint",
+        description="Set the sprint for a Jira issue. Can set to current sprint, next sprint, a specific sprint by name/ID, or remove the sprint entirely.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {
+                    "type": "string",
+                    "description": "The Jira issue key"
+                },
+                "sprint_option": {
+                    "type": "string",
+                    "description": "Sprint selection option: 'current' for current active sprint, 'next' for next planned sprint, 'specific' to specify a sprint by name/ID, or 'none' to remove the sprint",
+                    "enum": ["current", "next", "specific", "none"]
+                },
+                "sprint_value": {
+                    "type": "string",
+                    "description": "Sprint name or ID (required only when sprint_option is 'specific')"
+                },
+                "board_id": {
+                    "type": "integer",
+                    "description": "Board ID to search for sprints (optional, will auto-detect if not provided)"
+                }
+            },
+            "required": ["issue_key", "sprint_option"]
+        }
+    ),
+    Tool(
+        name="set_epic_link",
+        description="Set or remove the epic link for a Jira issue. Links an issue to an epic or removes the epic link.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {
+                    "type": "string",
+                    "description": "The Jira issue key to update"
+                },
+                "epic_key": {
+                    "type": "string",
+                    "description": "The epic issue key to link to (e.g., PROJ-123), or null/empty string to remove the epic link"
+                }
+            },
+            "required": ["issue_key"]
+        }
+    ),
+    Tool(
+        name="get_components",
+        description="Get available components for a project",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "project_key": {
+                    "type": "string",
+                    "description": "Project key"
+                }
+            },
+            "required": ["project_key"]
+        }
+    ),
+    Tool(
+        name="set_components",
+        description="Set components for a Jira issue. Replaces existing components with the provided list.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {
+                    "type": "string",
+                    "description": "The Jira issue key"
+                },
+                "components": {
+                    "type": "array",
+                    "items": {
+                        "type": "string"
+                    },
+                    "description": "List of component names to set. Use empty array to remove all components."
+                }
+            },
+            "required": ["issue_key", "components"]
+        }
+    ),
+    Tool(
+        name="get_issue_sprint_history",
+        description="Get the history of sprint changes for an issue. Shows when the issue was added to or removed from sprints.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {
+                    "type": "string",
+                    "description": "The Jira issue key (e.g., PROJ-123)"
+                }
+            },
+            "required": ["issue_key"]
+        }
+    ),
+    Tool(
+        name="analyze_sprint_scope",
+        description="Analyze a sprint to identify planned vs added issues, punted issues, and calculate predictability. Uses Jira's sprint report API for accurate data including removed/punted issues.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "sprint_name": {
+                    "type": "string",
+                    "description": "The sprint name to analyze"
+                },
+                "board_id": {
+                    "type": "integer",
+                    "description": "Board ID (optional, will auto-detect if not provided)"
+                }
+            },
+            "required": ["sprint_name"]
+        }
+    ),
+    Tool(
+        name="get_issue_cycle_time",
+        description="Get the cycle time and status transition timeline for a single issue. Shows time from first active status (In Progress) to last done status (Closed), with time spent in each status.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_key": {
+                    "type": "string",
+                    "description": "The Jira issue key (e.g., PROJ-123)"
+                }
+            },
+            "required": ["issue_key"]
+        }
+    ),
+    Tool(
+        name="analyze_cycle_time",
+        description="Analyze cycle time statistics for completed issues in a date range or sprint. Shows median, average, 85th percentile cycle times, breakdown by issue type, and flags outliers. Provide either start_date+end_date or sprint_name.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "start_date": {
+                    "type": "string",
+                    "description": "Start date for resolution range (YYYY-MM-DD). Issues resolved on or after this date are included."
+                },
+                "end_date": {
+                    "type": "string",
+                    "description": "End date for resolution range (YYYY-MM-DD). Issues resolved before this date are included."
+                },
+                "team": {
+                    "type": "string",
+                    "description": "Filter by AssignedTeam value (optional, e.g., 'rhos-connectivity-neutron-gluon')"
+                },
+                "sprint_name": {
+                    "type": "string",
+                    "description": "Sprint name to analyze (optional, alternative to date range)"
+                },
+                "board_id": {
+                    "type": "integer",
+                    "description": "Board ID (optional, only used with sprint_name)"
+                }
+            }
+        }
+    )
+]
+
+ANALYTICS_TOOL_DEFINITIONS: List[Tool] = [t for t in TOOL_DEFINITIONS if t.name in ANALYTICS_TOOLS]
+
+
 class JiraMCPServer:
     def __init__(self):
         self.server = Server("jira-mcp-server")
         self.jira_client: Optional[JIRA] = None
+        self._fields_cache: Optional[List[dict]] = None
+        self._fields_cache_ts: float = 0
+        self._field_id_by_name: Dict[str, str] = {}
+        self._sprint_field_id: Optional[str] = None
+        self._epic_link_field_id: Optional[str] = None
+        self._story_points_field_id: Optional[str] = None
+        self._assigned_team_field_id: Optional[str] = None
+        self._issue_cache: Dict[Tuple[str, str, str], Tuple[float, Issue]] = {}
+        self._meta_cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+        self._sprint_locations: Dict[str, Tuple[float, int, int]] = {}
+        self._assignee_cache: Dict[str, dict] = {}
+        # Tool calls run concurrently on worker threads: _cache_lock guards the
+        # issue, metadata, sprint and assignee caches, _fields_lock serializes
+        # field catalog refreshes
+        self._cache_lock = threading.Lock()
+        self._fields_lock = threading.Lock()
+        self._current_user: Optional[str] = None
+        self._comment_url_template: Optional[str] = None
+        self._browse_url: str = ''
+        self._init_lock = asyncio.Lock()
+        self._tool_call_slots = asyncio.Semaphore(MAX_CONCURRENT_TOOL_CALLS)
+        self._page_size = int(os.getenv("JIRA_PAGE_SIZE", PAGE_SIZE))
         self.analytics_only = os.getenv("JIRA_ANALYTICS_MODE", "full").lower() == "analytics-only"
         if self.analytics_only:
             logger.info("Running in analytics-only mode (basic tools disabled)")
@@ -56,396 +585,91 @@ class JiraMCPServer:
         
     def _setup_tools(self):
         """Set up all available tools"""
-        
+
+        # Tool name -> adapter unpacking the call arguments for its handler
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], List[TextContent]]] = {
+            "get_issue": lambda args: self._get_issue(args["issue_key"]),
+            "get_issues": lambda args: self._get_issues(args["issue_keys"]),
+            "search_issues": lambda args: self._search_issues(
+                args["jql"],
+                args.get("max_results", 50),
+                args.get("batch_size")
+            ),
+            "create_issue": lambda args: self._create_issue(
+                args["project_key"],
+                args["issue_type"],
+                args["summary"],
+                args["description"],
+                args.get("priority", "Normal"),
+                args.get("due_date"),
+                args.get("epic_name")
+            ),
+            "update_issue": lambda args: self._update_issue(
+                args["issue_key"],
+                args.get("summary"),
+                args.get("description"),
+                args.get("story_points"),
+                args.get("priority"),
+                args.get("assignee"),
+                args.get("security_level")
+            ),
+            "add_comment": lambda args: self._add_comment(
+                args["issue_key"],
+                args["comment"],
+                args.get("security_level")
+            ),
+            "get_comments": lambda args: self._get_comments(args["issue_key"]),
+            "transition_issue": lambda args: self._transition_issue(
+                args["issue_key"],
+                args["transition_name"]
+            ),
+            "get_project": lambda args: self._get_project(args["project_key"]),
+            "get_issue_types": lambda args: self._get_issue_types(args["project_key"]),
+            "get_my_issues": lambda args: self._get_my_issues(args.get("max_results", 20)),
+            "get_project_issues": lambda args: self._get_project_issues(
+                args["project_key"],
+                args.get("max_results", 50),
+                args.get("batch_size")
+            ),
+            "set_sprint": lambda args: self._set_sprint(
+                args["issue_key"],
+                args["sprint_option"],
+                args.get("sprint_value"),
+                args.get("board_id")
+            ),
+            "set_epic_link": lambda args: self._set_epic_link(
+                args["issue_key"],
+                args.get("epic_key")
+            ),
+            "get_components": lambda args: self._get_components(args["project_key"]),
+            "set_components": lambda args: self._set_components(
+                args["issue_key"],
+                args["components"]
+            ),
+            "get_issue_sprint_history": lambda args: self._get_issue_sprint_history(args["issue_key"]),
+            "analyze_sprint_scope": lambda args: self._analyze_sprint_scope(
+                args["sprint_name"],
+                args.get("board_id")
+            ),
+            "get_issue_cycle_time": lambda args: self._get_issue_cycle_time(args["issue_key"]),
+            "analyze_cycle_time": lambda args: self._analyze_cycle_time(
+                start_date=args.get("start_date"),
+                end_date=args.get("end_date"),
+                team=args.get("team"),
+                sprint_name=args.get("sprint_name"),
+                board_id=args.get("board_id")
+            ),
+        }
+
+        if self.analytics_only:
+            tools = ANALYTICS_TOOL_DEFINITIONS
+        else:
+            tools = TOOL_DEFINITIONS
+
         @self.server.list_tools()
         async def list_tools() -> List[Tool]:
             """List all available Jira tools"""
-            all_tools = [
-                Tool(
-                    name="get_issue",
-                    description="Get detailed information about a specific Jira issue",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "issue_key": {
-                                "type": "string",
-                                "description": "The Jira issue key (e.g., PROJ-123)"
-                            }
-                        },
-                        "required": ["issue_key"]
-                    }
-                ),
-                Tool(
-                    name="search_issues",
-                    description="Search for Jira issues using JQL (Jira Query Language)",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "jql": {
-                                "type": "string",
-                                "description": "JQL query string (e.g., 'project = PROJ AND status = Open')"
-                            },
-                            "max_results": {
-                                "type": "integer",
-                                "description": "Maximum number of results to return",
-                                "default": 50
-                            }
-                        },
-                        "required": ["jql"]
-                    }
-                ),
-                Tool(
-                    name="create_issue",
-                    description="Create a new Jira issue",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_key": {
-                                "type": "string",
-                                "description": "Project key (e.g., PROJ)"
-                            },
-                            "issue_type": {
-                                "type": "string",
-                                "description": "Issue type (e.g., Task, Bug, Story, Epic)"
-                            },
-                            "summary": {
-                                "type": "string",
-                                "description": "Issue title/summary"
-                            },
-                            "description": {
-                                "type": "string",
-                                "description": "Issue description"
-                            },
-                            "priority": {
-                                "type": "string",
-                                "description": "Priority level (e.g., Blocker, Critical, Major, Minor, Normal, Undefined)",
-                                "default": "Normal"
-                            },
-                            "due_date": {
-                                "type": "string",
-                                "description": "Due date in YYYY-MM-DD format (optional)"
-                            },
-                            "epic_name": {
-                                "type": "string",
-                                "description": "Epic name (required when issue_type is Epic)"
-                            }
-                        },
-                        "required": ["project_key", "issue_type", "summary", "description"]
-                    }
-                ),
-                Tool(
-                    name="update_issue",
-                    description="Update an existing Jira issue",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "issue_key": {
-                                "type": "string",
-                                "description": "The Jira issue key"
-                            },
-                            "summary": {
-                                "type": "string",
-                                "description": "New summary (optional)"
-                            },
-                            "description": {
-                                "type": "string",
-                                "description": "New description (optional)"
-                            },
-                            "story_points": {
-                                "type": "number",
-                                "description": "Story points estimate (optional)"
-                            },
-                            "priority": {
-                                "type": "string",
-                                "description": "Priority level (e.g., Blocker, Critical, Major, Minor, Normal, Undefined)"
-                            },
-                            "assignee": {
-                                "type": "string",
-                                "description": "Assignee email, account ID, or 'me'/'myself' for current user (optional)"
-                            },
-                            "security_level": {
-                                "type": "string",
-                                "description": "Security level name or ID (optional, e.g., 'Red Hat Employee', 'Team'). Use empty string to remove security level."
-                            }
-                        },
-                        "required": ["issue_key"]
-                    }
-                ),
-                Tool(
-                    name="add_comment",
-                    description="Add a comment to a Jira issue",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "issue_key": {
-                                "type": "string",
-                                "description": "The Jira issue key"
-                            },
-                            "comment": {
-                                "type": "string",
-                                "description": "Comment text"
-                            },
-                            "security_level": {
-                                "type": "string",
-                                "description": "Security level name or ID (optional, e.g., 'Employee', 'Internal')"
-                            }
-                        },
-                        "required": ["issue_key", "comment"]
-                    }
-                ),
-                Tool(
-                    name="get_comments",
-                    description="Get all comments for a Jira issue",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "issue_key": {
-                                "type": "string",
-                                "description": "The Jira issue key"
-                            }
-                        },
-                        "required": ["issue_key"]
-                    }
-                ),
-                Tool(
-                    name="transition_issue",
-                    description="Move an issue through workflow states",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "issue_key": {
-                                "type": "string",
-                                "description": "The Jira issue key"
-                            },
-                            "transition_name": {
-                                "type": "string",
-                                "description": "Name of the transition (e.g., 'In Progress', 'Done')"
-                            }
-                        },
-                        "required": ["issue_key", "transition_name"]
-                    }
-                ),
-                Tool(
-                    name="get_project",
-                    description="Get information about a Jira project",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_key": {
-                                "type": "string",
-                                "description": "Project key"
-                            }
-                        },
-                        "required": ["project_key"]
-                    }
-                ),
-                Tool(
-                    name="get_issue_types",
-                    description="Get available issue types for a project",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_key": {
-                                "type": "string",
-                                "description": "Project key"
-                            }
-                        },
-                        "required": ["project_key"]
-                    }
-                ),
-                Tool(
-                    name="get_my_issues",
-                    description="Get issues assigned to the current user",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "max_results": {
-                                "type": "integer",
-                                "description": "Maximum number of results to return",
-                                "default": 20
-                            }
-                        }
-                    }
-                ),
-                Tool(
-                    name="get_project_issues",
-                    description="Get all issues for a specific project",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_key": {
-                                "type": "string",
-                                "description": "Project key"
-                            },
-                            "max_results": {
-                                "type": "integer",
-                                "description": "Maximum number of results to return",
-                                "default": 50
-                            }
-                        },
-                        "required": ["project_key"]
-                    }
-                ),
-                Tool(
-                    name="set_sprint",
-                    description="Set the sprint for a Jira issue. Can set to current sprint, next sprint, a specific sprint by name/ID, or remove the sprint entirely.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "issue_key": {
-                                "type": "string",
-                                "description": "The Jira issue key"
-                            },
-                            "sprint_option": {
-                                "type": "string",
-                                "description": "Sprint selection option: 'current' for current active sprint, 'next' for next planned sprint, 'specific' to specify a sprint by name/ID, or 'none' to remove the sprint",
-                                "enum": ["current", "next", "specific", "none"]
-                            },
-                            "sprint_value": {
-                                "type": "string",
-                                "description": "Sprint name or ID (required only when sprint_option is 'specific')"
-                            },
-                            "board_id": {
-                                "type": "integer",
-                                "description": "Board ID to search for sprints (optional, will auto-detect if not provided)"
-                            }
-                        },
-                        "required": ["issue_key", "sprint_option"]
-                    }
-                ),
-                Tool(
-                    name="set_epic_link",
-                    description="Set or remove the epic link for a Jira issue. Links an issue to an epic or removes the epic link.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "issue_key": {
-                                "type": "string",
-                                "description": "The Jira issue key to update"
-                            },
-                            "epic_key": {
-                                "type": "string",
-                                "description": "The epic issue key to link to (e.g., PROJ-123), or null/empty string to remove the epic link"
-                            }
-                        },
-                        "required": ["issue_key"]
-                    }
-                ),
-                Tool(
-                    name="get_components",
-                    description="Get available components for a project",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "project_key": {
-                                "type": "string",
-                                "description": "Project key"
-                            }
-                        },
-                        "required": ["project_key"]
-                    }
-                ),
-                Tool(
-                    name="set_components",
-                    description="Set components for a Jira issue. Replaces existing components with the provided list.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "issue_key": {
-                                "type": "string",
-                                "description": "The Jira issue key"
-                            },
-                            "components": {
-                                "type": "array",
-                                "items": {
-                                    "type": "string"
-                                },
-                                "description": "List of component names to set. Use empty array to remove all components."
-                            }
-                        },
-                        "required": ["issue_key", "components"]
-                    }
-                ),
-                Tool(
-                    name="get_issue_sprint_history",
-                    description="Get the history of sprint changes for an issue. Shows when the issue was added to or removed from sprints.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "issue_key": {
-                                "type": "string",
-                                "description": "The Jira issue key (e.g., PROJ-123)"
-                            }
-                        },
-                        "required": ["issue_key"]
-                    }
-                ),
-                Tool(
-                    name="analyze_sprint_scope",
-                    description="Analyze a sprint to identify planned vs added issues, punted issues, and calculate predictability. Uses Jira's sprint report API for accurate data including removed/punted issues.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "sprint_name": {
-                                "type": "string",
-                                "description": "The sprint name to analyze"
-                            },
-                            "board_id": {
-                                "type": "integer",
-                                "description": "Board ID (optional, will auto-detect if not provided)"
-                            }
-                        },
-                        "required": ["sprint_name"]
-                    }
-                ),
-                Tool(
-                    name="get_issue_cycle_time",
-                    description="Get the cycle time and status transition timeline for a single issue. Shows time from first active status (In Progress) to last done status (Closed), with time spent in each status.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "issue_key": {
-                                "type": "string",
-                                "description": "The Jira issue key (e.g., PROJ-123)"
-                            }
-                        },
-                        "required": ["issue_key"]
-                    }
-                ),
-                Tool(
-                    name="analyze_cycle_time",
-                    description="Analyze cycle time statistics for completed issues in a date range or sprint. Shows median, average, 85th percentile cycle times, breakdown by issue type, and flags outliers. Provide either start_date+end_date or sprint_name.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "start_date": {
-                                "type": "string",
-                                "description": "Start date for resolution range (YYYY-MM-DD). Issues resolved on or after this date are included."
-                            },
-                            "end_date": {
-                                "type": "string",
-                                "description": "End date for resolution range (YYYY-MM-DD). Issues resolved before this date are included."
-                            },
-                            "team": {
-                                "type": "string",
-                                "description": "Filter by AssignedTeam value (optional, e.g., 'rhos-connectivity-neutron-gluon')"
-                            },
-                            "sprint_name": {
-                                "type": "string",
-                                "description": "Sprint name to analyze (optional, alternative to date range)"
-                            },
-                            "board_id": {
-                                "type": "integer",
-                                "description": "Board ID (optional, only used with sprint_name)"
-                            }
-                        }
-                    }
-                )
-            ]
-
-            if self.analytics_only:
-                return [t for t in all_tools if t.name in ANALYTICS_TOOLS]
-            return all_tools
+            return tools
 
         @self.server.call_tool()
         async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
@@ -453,109 +677,33 @@ class JiraMCPServer:
             
             # Initialize Jira client if not already done
             if not self.jira_client:
-                await self._init_jira_client()
+                async with self._init_lock:
+                    if not self.jira_client:
+                        await self._init_jira_client()
             
             # Block non-analytics tools in analytics-only mode
             if self.analytics_only and name not in ANALYTICS_TOOLS:
                 return [TextContent(type="text", text=f"Tool '{name}' is not available in analytics-only mode. Set JIRA_ANALYTICS_MODE=full to enable all tools.")]
 
+            handler = self._handlers.get(name)
+            if handler is None:
+                return [TextContent(type="text", text=f"Unknown tool: {name}")]
+
             try:
-                if name == "get_issue":
-                    return await self._get_issue(arguments["issue_key"])
-                elif name == "search_issues":
-                    return await self._search_issues(
-                        arguments["jql"],
-                        arguments.get("max_results", 50)
-                    )
-                elif name == "create_issue":
-                    return await self._create_issue(
-                        arguments["project_key"],
-                        arguments["issue_type"],
-                        arguments["summary"],
-                        arguments["description"],
-                        arguments.get("priority", "Normal"),
-                        arguments.get("due_date"),
-                        arguments.get("epic_name")
-                    )
-                elif name == "update_issue":
-                    return await self._update_issue(
-                        arguments["issue_key"],
-                        arguments.get("summary"),
-                        arguments.get("description"),
-                        arguments.get("story_points"),
-                        arguments.get("priority"),
-                        arguments.get("assignee"),
-                        arguments.get("security_level")
-                    )
-                elif name == "add_comment":
-                    return await self._add_comment(
-                        arguments["issue_key"],
-                        arguments["comment"],
-                        arguments.get("security_level")
-                    )
-                elif name == "get_comments":
-                    return await self._get_comments(arguments["issue_key"])
-                elif name == "transition_issue":
-                    return await self._transition_issue(
-                        arguments["issue_key"],
-                        arguments["transition_name"]
-                    )
-                elif name == "get_project":
-                    return await self._get_project(arguments["project_key"])
-                elif name == "get_issue_types":
-                    return await self._get_issue_types(arguments["project_key"])
-                elif name == "get_my_issues":
-                    return await self._get_my_issues(arguments.get("max_results", 20))
-                elif name == "get_project_issues":
-                    return await self._get_project_issues(
-                        arguments["project_key"],
-                        arguments.get("max_results", 50)
-                    )
-                elif name == "set_sprint":
-                    return await self._set_sprint(
-                        arguments["issue_key"],
-                        arguments["sprint_option"],
-                        arguments.get("sprint_value"),
-                        arguments.get("board_id")
-                    )
-                elif name == "set_epic_link":
-                    return await self._set_epic_link(
-                        arguments["issue_key"],
-                        arguments.get("epic_key")
-                    )
-                elif name == "get_components":
-                    return await self._get_components(arguments["project_key"])
-                elif name == "set_components":
-                    return await self._set_components(
-                        arguments["issue_key"],
-                        arguments["components"]
-                    )
-                elif name == "get_issue_sprint_history":
-                    return await self._get_issue_sprint_history(arguments["issue_key"])
-                elif name == "analyze_sprint_scope":
-                    return await self._analyze_sprint_scope(
-                        arguments["sprint_name"],
-                        arguments.get("board_id")
-                    )
-                elif name == "get_issue_cycle_time":
-                    return await self._get_issue_cycle_time(arguments["issue_key"])
-                elif name == "analyze_cycle_time":
-                    return await self._analyze_cycle_time(
-                        start_date=arguments.get("start_date"),
-                        end_date=arguments.get("end_date"),
-                        team=arguments.get("team"),
-                        sprint_name=arguments.get("sprint_name"),
-                        board_id=arguments.get("board_id")
-                    )
-                else:
-                    return [TextContent(type="text", text=f"Unknown tool: {name}")]
-                    
+                # Handlers make blocking jira-python calls, so run each one on a
+                # worker thread to keep the event loop free for other requests
+                async with self._tool_call_slots:
+                    return await asyncio.to_thread(handler, arguments)
             except Exception as e:
                 logger.error(f"Error calling tool {name}: {e}")
                 return [TextContent(type="text", text=f"Error: {str(e)}")]
 
     async def _init_jira_client(self):
-        """Initialize the Jira client with credentials"""
+        """Initialize the Jira client with credentials without blocking the event loop"""
+        await asyncio.to_thread(self._connect)
+
+    def _connect(self):
+        """Create the Jira client; this makes blocking HTTP requests"""
         try:
             server = os.getenv("JIRA_SERVER")
             email = os.getenv("JIRA_EMAIL")
@@ -569,180 +717,458 @@ class JiraMCPServer:
             if 'atlassian.net' in server:
                 self.jira_client = JIRA(
                     server=server,
-                    basic_auth=(email, api_token)
+                    basic_auth=(email, api_token),
+                    default_batch_sizes={Issue: self._page_size}
                 )
             else:
                 self.jira_client = JIRA(
                     server=server,
-                    token_auth=api_token
+                    token_auth=api_token,
+                    default_batch_sizes={Issue: self._page_size}
                 )
+            self._on_client_ready()
             logger.info("Successfully connected to Jira")
             
         except Exception as e:
             logger.error(f"Failed to initialize Jira client: {e}")
             raise
 
-    async def _get_issue(self, issue_key: str) -> List[TextContent]:
-        """Get detailed information about a Jira issue"""
-        try:
-            if not self.jira_client:
-                return [TextContent(type="text", text="Jira client not initialized")]
+    def _on_client_ready(self):
+        """Prepare per-client state once the Jira client has been created"""
+        self._configure_session()
+        self._comment_url_template = self.jira_client._get_url('issue/{}/comment')
+        self._browse_url = f"{self.jira_client.server_url}/browse/"
+        # Resolve the custom field IDs and the current user up front, in
+        # parallel; a failed user lookup is retried lazily on first use
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            executor.submit(lambda: self.current_user)
+            self._get_fields()
+
+    def _configure_session(self):
+        """Tune the Jira client's HTTP session for connection reuse.
+
+        Mounts a larger keep-alive connection pool so bursts of tool calls
+        reuse open TLS connections instead of reconnecting each time, and
+        decodes responses with orjson when it is installed.
+        """
+        session = self.jira_client._session
+        session.headers['Connection'] = 'keep-alive'
+        # Only retry connection-level failures here: the Jira session already
+        # retries 429/5xx responses with its own backoff
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=None)
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        if orjson:
+            # python-jira decodes every response with resp.json(); route that through orjson too
+            session.hooks['response'].append(self._decode_with_orjson)
 
-            issue = self.jira_client.issue(issue_key)
+    @staticmethod
+    def _decode_with_orjson(response, *args, **kwargs):
+        """Response hook replacing the response's json() with an orjson-based decoder"""
+        response.json = lambda **_: orjson.loads(response.content)
+        return response
 
-            # Try to find sprint information
-            sprint_info = "No sprint"
-            all_fields = self.jira_client.fields()
-            sprint_field = None
-            for field in all_fields:
-                if field.get('name', '').lower() == 'sprint':
-                    sprint_field = field['id']
-                    break
+    def _get_fields(self, ttl: int = FIELDS_CACHE_TTL) -> List[dict]:
+        """Return the Jira field catalog, refetching it once the cache is older than ttl seconds.
 
-            # Fallback to common sprint field IDs if not found by name
-            if not sprint_field:
-                for candidate in ['customfield_12310940', 'customfield_10020', 'customfield_10010']:
-                    if hasattr(issue.fields, candidate):
-                        sprint_field = candidate
-                        break
+        The sprint, epic link, story points and assigned team field IDs are
+        resolved in the same pass so callers can use them without rescanning
+        the catalog.
+        """
+        fields = self._fields_cache
+        if fields is not None and time.time() - self._fields_cache_ts < ttl:
+            return fields
+
+        with self._fields_lock:
+            # Another thread may have refreshed the catalog while we waited
+            if self._fields_cache is not None and time.time() - self._fields_cache_ts < ttl:
+                return self._fields_cache
+            return self._refresh_fields()
+
+    def _refresh_fields(self) -> List[dict]:
+        """Fetch the field catalog and resolve the field IDs; call with _fields_lock held"""
+        fields = self.jira_client.fields()
+        field_id_by_name = {}
+        story_points_field_id = None
+        assigned_team_field_id = None
+        assigned_team_fallback_id = None
+        for field in fields:
+            name = field.get('name', '').lower()
+            field_id_by_name.setdefault(name, field['id'])
+            if story_points_field_id is None and name in STORY_POINTS_FIELD_NAMES:
+                story_points_field_id = field['id']
+            if assigned_team_field_id is None:
+                # Prefer an exact name or JQL clause match; otherwise remember
+                # the first field that looks like an assigned team field
+                if field.get('name') == 'Assigned Team' or 'AssignedTeam' in field.get('clauseNames', []):
+                    assigned_team_field_id = field['id']
+                elif assigned_team_fallback_id is None:
+                    field_id = field['id'].casefold()
+                    if any(token in name or token in field_id for token in ASSIGNED_TEAM_FIELD_TOKENS):
+                        assigned_team_fallback_id = field['id']
+
+        self._field_id_by_name = field_id_by_name
+        self._sprint_field_id = field_id_by_name.get('sprint')
+        self._epic_link_field_id = field_id_by_name.get('epic link')
+        self._story_points_field_id = story_points_field_id
+        self._assigned_team_field_id = assigned_team_field_id or assigned_team_fallback_id
+        # Publish the catalog last, so lock-free readers of a fresh catalog
+        # always see the field IDs resolved from it
+        self._fields_cache_ts = time.time()
+        self._fields_cache = fields
+        return fields
+
+    @property
+    def current_user(self) -> str:
+        """Username of the authenticated user, looked up once per client"""
+        if self._current_user is None:
+            self._current_user = self.jira_client.current_user()
+        return self._current_user
+
+    @property
+    def assignee_key(self) -> str:
+        """Key identifying a user in assignee fields: accountId on Cloud, name on Server/DC"""
+        return 'accountId' if getattr(self.jira_client, '_is_cloud', False) else 'name'
+
+    @property
+    def sprint_field_id(self) -> Optional[str]:
+        """ID of the Sprint custom field, if the field catalog has one"""
+        self._get_fields()
+        return self._sprint_field_id
+
+    @property
+    def epic_link_field_id(self) -> Optional[str]:
+        """ID of the Epic Link custom field, if the field catalog has one"""
+        self._get_fields()
+        return self._epic_link_field_id
+
+    @property
+    def story_points_field_id(self) -> Optional[str]:
+        """ID of the Story Points custom field, if the field catalog has one"""
+        self._get_fields()
+        return self._story_points_field_id
 
-            if sprint_field and hasattr(issue.fields, sprint_field):
-                sprint_data = getattr(issue.fields, sprint_field)
-                if sprint_data:
-                    if isinstance(sprint_data, list) and len(sprint_data) > 0:
-                        # Get the last (current) sprint
-                        sprint = sprint_data[-1]
-                        if hasattr(sprint, 'name'):
-                            sprint_info = sprint.name
-                        else:
-                            # Sprint might be a string, try to parse it
-                            sprint_str = str(sprint)
-                            # Extract name from string format: "com.atlassian.greenhopper.service.sprint.Sprint@...[name=Sprint Name,...]"
-                            if 'name=' in sprint_str:
-                                name_start = sprint_str.find('name=') + 5
-                                name_end = sprint_str.find(',', name_start)
-                                if name_end == -1:
-                                    name_end = sprint_str.find(']', name_start)
-                                sprint_info = sprint_str[name_start:name_end]
-                    elif hasattr(sprint_data, 'name'):
-                        sprint_info = sprint_data.name
-
-            # Try to find epic link information
-            epic_link_info = "No epic link"
-            epic_link_field = None
-            for field in all_fields:
-                if field.get('name', '').lower() == 'epic link':
-                    epic_link_field = field['id']
-                    break
+    @staticmethod
+    def _first_present_field(issue, candidates) -> Optional[str]:
+        """Return the first candidate custom field ID present on the issue"""
+        # Check the raw JSON rather than probing attributes on the resource
+        raw_fields = issue.raw.get('fields', {})
+        return next((candidate for candidate in candidates if candidate in raw_fields), None)
+
+    def _fetch_issue(self, issue_key: str, expand: str = '') -> Issue:
+        """Fetch an issue, reusing a cached copy fetched within the last ISSUE_CACHE_TTL seconds"""
+        issue = self._cached_issue(issue_key, expand)
+        if issue is None:
+            issue = self.jira_client.issue(issue_key, expand=expand or None)
+            self._cache_issue(issue, expand)
+        return issue
+
+    def _cached_issue(self, issue_key: str, expand: str = '', fields: str = '*all') -> Optional[Issue]:
+        """Return the cached copy of an issue if it is still fresh"""
+        with self._cache_lock:
+            cached = self._issue_cache.get((issue_key.upper(), expand, fields))
+        if cached and time.time() - cached[0] < ISSUE_CACHE_TTL:
+            return cached[1]
+        return None
 
-            # Fallback to common epic link field IDs if not found by name
-            if not epic_link_field:
-                for candidate in ['customfield_12311140', 'customfield_10014', 'customfield_10008']:
-                    if hasattr(issue.fields, candidate):
-                        epic_link_field = candidate
-                        break
+    def _cache_issue(self, issue: Issue, expand: str = '', fields: str = '*all',
+                     issue_key: Optional[str] = None):
+        """Store a fetched issue, evicting the oldest entries once the cache is full.
 
-            if epic_link_field and hasattr(issue.fields, epic_link_field):
-                epic_link_data = getattr(issue.fields, epic_link_field)
-                if epic_link_data:
-                    # Epic link is typically just the epic key (e.g., "PROJ-123")
-                    epic_link_info = str(epic_link_data)
-
-            # Get security level information
-            security_level_info = "Public (no security level)"
-            if hasattr(issue.fields, 'security') and issue.fields.security:
-                security_level_info = issue.fields.security.name
-
-            # Try to find story points information
-            story_points_info = None
-            story_point_field = None
-            for field in all_fields:
-                if field.get('name', '').lower() in ['story points', 'story point estimate']:
-                    story_point_field = field['id']
-                    break
+        issue_key is the key it was requested by, when that may differ from
+        the issue's current key (a moved or renamed issue). Keys are stored
+        upper-cased, as issue keys are case-insensitive.
+        """
+        cache_key = ((issue_key or issue.key).upper(), expand, fields)
+        with self._cache_lock:
+            # Re-insert so a refreshed entry moves to the back of the eviction order
+            self._issue_cache.pop(cache_key, None)
+            self._issue_cache[cache_key] = (time.time(), issue)
+            while len(self._issue_cache) > ISSUE_CACHE_MAX_ENTRIES:
+                self._issue_cache.pop(next(iter(self._issue_cache)), None)
+
+    def _fetch_issues_with_changelog(self, issue_keys: List[str], fields: str = '*all') -> Dict[str, Issue]:
+        """Fetch many issues with their changelog, keyed by issue key.
+
+        Cached issues are reused, including full copies when only some fields
+        were asked for; the rest are fetched in batches instead of
+        one request per issue, through the bulk fetch endpoint on Jira Cloud
+        and `key in (...)` searches elsewhere. Results are keyed by the
+        requested key, also for moved issues. Keys that do not resolve to an
+        issue are left out of the result.
+        """
+        issues = {}
+        uncached_keys = []
+        for issue_key in issue_keys:
+            issue = self._cached_issue(issue_key, 'changelog') or self._cached_issue(
+                issue_key, 'changelog', fields)
+            if issue is not None:
+                issues[issue_key] = issue
+            else:
+                uncached_keys.append(issue_key)
 
-            # Fallback to common story point field IDs if not found by name
-            if not story_point_field:
-                for candidate in ['customfield_10016', 'customfield_10026', 'customfield_10004']:
-                    if hasattr(issue.fields, candidate):
-                        story_point_field = candidate
-                        break
+        fetched = self._fetch_issues_by_key(uncached_keys, fields=fields, expand='changelog')
+        for issue_key, issue in fetched.items():
+            issues[issue_key] = issue
+            self._cache_issue(issue, 'changelog', fields, issue_key=issue_key)
+        return issues
 
-            if story_point_field and hasattr(issue.fields, story_point_field):
-                story_points_data = getattr(issue.fields, story_point_field)
-                if story_points_data is not None:
-                    story_points_info = story_points_data
-
-            issue_data = {
-                "key": issue.key,
-                "summary": issue.fields.summary,
-                "description": issue.fields.description or "No description",
-                "status": issue.fields.status.name,
-                "priority": issue.fields.priority.name if issue.fields.priority else "None",
-                "assignee": issue.fields.assignee.displayName if issue.fields.assignee else "Unassigned",
-                "reporter": issue.fields.reporter.displayName if issue.fields.reporter else "Unknown",
-                "created": str(issue.fields.created),
-                "updated": str(issue.fields.updated),
-                "project": issue.fields.project.name,
-                "issue_type": issue.fields.issuetype.name,
-                "sprint": sprint_info,
-                "epic_link": epic_link_info,
-                "security_level": security_level_info,
-                "story_points": story_points_info,
-                "url": f"{self.jira_client.server_url}/browse/{issue.key}"
-            }
+    def _fetch_issues_by_key(self, issue_keys: List[str], fields: str = '*all',
+                             expand: Optional[str] = None) -> Dict[str, Issue]:
+        """Fetch issues by key, keyed by the requested key.
 
-            # Build story points line - only show if set
-            story_points_line = ""
-            if issue_data['story_points'] is not None:
-                story_points_line = f"**Story Points:** {issue_data['story_points']}\n"
-
-            text = (f"**Issue: {issue_data['key']}**\n\n"
-                   f"**Summary:** {issue_data['summary']}\n"
-                   f"**Status:** {issue_data['status']}\n"
-                   f"**Priority:** {issue_data['priority']}\n"
-                   f"**Assignee:** {issue_data['assignee']}\n"
-                   f"**Reporter:** {issue_data['reporter']}\n"
-                   f"**Type:** {issue_data['issue_type']}\n"
-                   f"**Project:** {issue_data['project']}\n"
-                   f"**Sprint:** {issue_data['sprint']}\n"
-                   f"**Epic Link:** {issue_data['epic_link']}\n"
-                   f"{story_points_line}"
-                   f"**Security Level:** {issue_data['security_level']}\n"
-                   f"**Created:** {issue_data['created']}\n"
-                   f"**Updated:** {issue_data['updated']}\n"
-                   f"**URL:** {issue_data['url']}\n\n"
-                   f"**Description:**\n{issue_data['description']}")
+        Keys are fetched JQL_KEY_BATCH_SIZE per request with the batches
+        fetched concurrently. Searches return moved or renamed issues under
+        their current key, so any requested key the batches did not return is
+        fetched on its own, which follows the redirect. Keys that do not
+        resolve to an issue are left out of the result.
+        """
+        def fetch_batch(batch_keys):
+            if getattr(self.jira_client, '_is_cloud', False):
+                return self._bulk_fetch_issues(batch_keys, fields=fields, expand=expand)
+            jql = f"key in ({', '.join(batch_keys)})"
+            # Skip query validation so unknown keys are ignored instead of failing the search
+            return self._search_all_issues(jql, fields=fields, expand=expand,
+                                           validate_query=False)
+
+        def fetch_one(issue_key):
+            try:
+                return self.jira_client.issue(issue_key, fields=fields, expand=expand)
+            except JIRAError as e:
+                if e.status_code == 404:
+                    return None
+                raise
+
+        batches = [issue_keys[i:i + JQL_KEY_BATCH_SIZE]
+                   for i in range(0, len(issue_keys), JQL_KEY_BATCH_SIZE)]
+        with ThreadPoolExecutor(max_workers=PAGINATION_WORKERS) as executor:
+            # Issue keys are case-insensitive; results carry the canonical upper-case key
+            found = {issue.key: issue for batch in executor.map(fetch_batch, batches)
+                     for issue in batch}
+            issues = {}
+            missing_keys = []
+            for issue_key in issue_keys:
+                issue = found.get(issue_key.upper())
+                if issue is None:
+                    missing_keys.append(issue_key)
+                else:
+                    issues[issue_key] = issue
+            for issue_key, issue in zip(missing_keys, executor.map(fetch_one, missing_keys)):
+                if issue is not None:
+                    issues[issue_key] = issue
+        return issues
 
-            return [TextContent(type="text", text=text)]
+    def _bulk_fetch_issues(self, issue_keys: List[str], fields: str = '*all',
+                           expand: Optional[str] = None) -> List[Issue]:
+        """Fetch up to 100 issues in one request with Jira Cloud's bulk fetch endpoint.
+        Unknown keys are reported by the server as errors and skipped."""
+        payload = {'issueIdsOrKeys': issue_keys, 'fields': fields.split(',')}
+        if expand:
+            payload['expand'] = expand.split(',')
+        response = self.jira_client._session.post(
+            self.jira_client._get_url('issue/bulkfetch'), json=payload)
+        response.raise_for_status()
+        data = json_loads(response.content)
+        return [Issue(self.jira_client._options, self.jira_client._session, raw=raw)
+                for raw in data.get('issues', [])]
+
+    def _invalidate_issue(self, *issue_keys: str):
+        """Drop every cached copy of an issue after it has been modified.
+
+        Pass the key the write was made with and, when known, the issue's
+        current key. Entries cached under either are dropped, and so are
+        entries holding an issue whose current key is either one (a moved
+        issue cached under its old key).
+        """
+        keys = {issue_key.upper() for issue_key in issue_keys}
+        with self._cache_lock:
+            stale = [cache_key for cache_key, (_, issue) in self._issue_cache.items()
+                     if cache_key[0] in keys or issue.key.upper() in keys]
+            for cache_key in stale:
+                del self._issue_cache[cache_key]
+
+    def _cached_meta(self, kind: str, project_key: str, fetch: Callable[[], Any]) -> Any:
+        """Return project metadata from the cache, calling `fetch` if it is missing or stale"""
+        cache_key = (kind, project_key)
+        with self._cache_lock:
+            cached = self._meta_cache.get(cache_key)
+        if cached and time.time() - cached[0] < META_CACHE_TTL:
+            return cached[1]
+        # Fetch outside the lock so a slow request doesn't hold up other lookups
+        value = fetch()
+        with self._cache_lock:
+            self._meta_cache[cache_key] = (time.time(), value)
+        return value
+
+    def _fetch_project(self, project_key: str):
+        """Fetch a project, reusing a cached copy"""
+        return self._cached_meta('project', project_key,
+                                 lambda: self.jira_client.project(project_key))
+
+    def _fetch_components(self, project_key: str) -> list:
+        """Fetch the components of a project, reusing a cached copy"""
+        return self._cached_meta('components', project_key,
+                                 lambda: self.jira_client.project_components(project_key))
+
+    def _get_issue(self, issue_key: str) -> List[TextContent]:
+        """Get detailed information about a Jira issue"""
+        try:
+            if not self.jira_client:
+                return [TextContent(type="text", text="Jira client not initialized")]
+
+            issue = self.jira_client.issue(issue_key, fields=self._issue_detail_fields())
+            return [TextContent(type="text", text=self._render_issue(issue))]
 
         except Exception as e:
             return [TextContent(type="text", text=f"Error fetching issue {issue_key}: {str(e)}")]
 
-    async def _search_issues(self, jql: str, max_results: int = 50) -> List[TextContent]:
+    def _get_issues(self, issue_keys: List[str]) -> List[TextContent]:
+        """Get detailed information about several Jira issues"""
+        try:
+            if not self.jira_client:
+                return [TextContent(type="text", text="Jira client not initialized")]
+
+            issues_by_key = self._fetch_issues_by_key(issue_keys, fields=self._issue_detail_fields())
+
+            parts = []
+            missing = []
+            for issue_key in issue_keys:
+                issue = issues_by_key.get(issue_key)
+                if issue is None:
+                    missing.append(issue_key)
+                else:
+                    parts.append(self._render_issue(issue))
+            if missing:
+                parts.append(f"**Not found:** {', '.join(missing)}\n")
+            return [TextContent(type="text", text="\n\n---\n\n".join(parts))]
+
+        except Exception as e:
+            return [TextContent(type="text", text=f"Error fetching issues: {str(e)}")]
+
+    def _issue_detail_fields(self) -> str:
+        """Fields rendered by _render_issue, plus the candidate custom field IDs
+        for any sprint/epic link/story points field not found by name"""
+        fields = ['summary', 'description', 'status', 'priority', 'assignee', 'reporter',
+                  'created', 'updated', 'project', 'issuetype', 'security']
+        for field_id, candidates in ((self.sprint_field_id, SPRINT_FIELD_CANDIDATES),
+                                     (self.epic_link_field_id, EPIC_LINK_FIELD_CANDIDATES),
+                                     (self.story_points_field_id, STORY_POINTS_FIELD_CANDIDATES)):
+            fields.extend([field_id] if field_id else candidates)
+        return ','.join(fields)
+
+    def _render_issue(self, issue) -> str:
+        """Render the detail view of an issue fetched with _issue_detail_fields"""
+        # Try to find sprint information
+        sprint_info = "No sprint"
+        # Fallback to common sprint field IDs if not found by name
+        sprint_field = self.sprint_field_id or self._first_present_field(
+            issue, SPRINT_FIELD_CANDIDATES)
+
+        sprint_data = getattr(issue.fields, sprint_field, None) if sprint_field else None
+        if sprint_data:
+            if isinstance(sprint_data, list):
+                # Get the last (current) sprint
+                sprint = sprint_data[-1]
+                sprint_name = getattr(sprint, 'name', _MISSING)
+                if sprint_name is not _MISSING:
+                    sprint_info = sprint_name
+                else:
+                    # Sprint might be a string, try to parse it
+                    # Extract name from string format: "com.atlassian.greenhopper.service.sprint.Sprint@...[name=Sprint Name,...]"
+                    match = SPRINT_NAME_RE.search(str(sprint))
+                    if match:
+                        sprint_info = match.group(1)
+            else:
+                sprint_name = getattr(sprint_data, 'name', _MISSING)
+                if sprint_name is not _MISSING:
+                    sprint_info = sprint_name
+
+        # Try to find epic link information
+        epic_link_info = "No epic link"
+        # Fallback to common epic link field IDs if not found by name
+        epic_link_field = self.epic_link_field_id or self._first_present_field(
+            issue, EPIC_LINK_FIELD_CANDIDATES)
+
+        epic_link_data = getattr(issue.fields, epic_link_field, None) if epic_link_field else None
+        if epic_link_data:
+            # Epic link is typically just the epic key (e.g., "PROJ-123")
+            epic_link_info = str(epic_link_data)
+
+        # Plain fields are read from the raw JSON rather than through the
+        # resource's attribute wrappers
+        fields_raw = issue.raw['fields']
+
+        # Get security level information
+        security_level_info = "Public (no security level)"
+        security = fields_raw.get('security')
+        if security:
+            security_level_info = security['name']
+
+        # Try to find story points information
+        story_points_info = None
+        # Fallback to common story point field IDs if not found by name
+        story_point_field = self.story_points_field_id or self._first_present_field(
+            issue, STORY_POINTS_FIELD_CANDIDATES)
+
+        if story_point_field:
+            story_points_info = getattr(issue.fields, story_point_field, None)
+
+        issue_data = {
+            "key": issue.key,
+            "summary": fields_raw.get('summary'),
+            "description": fields_raw.get('description') or "No description",
+            "status": fields_raw['status']['name'],
+            "priority": (fields_raw.get('priority') or {}).get('name', "None"),
+            "assignee": (fields_raw.get('assignee') or {}).get('displayName', "Unassigned"),
+            "reporter": (fields_raw.get('reporter') or {}).get('displayName', "Unknown"),
+            "created": fields_raw.get('created'),
+            "updated": fields_raw.get('updated'),
+            "project": fields_raw['project']['name'],
+            "issue_type": fields_raw['issuetype']['name'],
+            "sprint": sprint_info,
+            "epic_link": epic_link_info,
+            "security_level": security_level_info,
+            "story_points": story_points_info,
+            "url": f"{self._browse_url}{issue.key}"
+        }
+
+        # Build story points line - only show if set
+        issue_data['story_points_line'] = ""
+        if issue_data['story_points'] is not None:
+            issue_data['story_points_line'] = f"**Story Points:** {issue_data['story_points']}\n"
+
+        return ISSUE_TEMPLATE.format_map(issue_data)
+
+    def _search_issues(self, jql: str, max_results: int = 50,
+                             batch_size: Optional[int] = None) -> List[TextContent]:
         """Search for issues using JQL"""
         try:
-            issues = self.jira_client.search_issues(jql, maxResults=max_results)
+            issues = self._search_issue_list(jql, max_results, 'summary,status,assignee', batch_size)
             
             if not issues:
                 return [TextContent(type="text", text="No issues found matching the query.")]
             
-            result_text = f"**Found {len(issues)} issue(s):**\n\n"
+            parts = [f"**Found {len(issues)} issue(s):**\n\n"]
             
             for issue in issues:
-                result_text += (
-                    f"• **{issue.key}** - {issue.fields.summary}\n"
-                    f"  Status: {issue.fields.status.name} | "
-                    f"Assignee: {issue.fields.assignee.displayName if issue.fields.assignee else 'Unassigned'}\n"
-                    f"  URL: {self.jira_client.server_url}/browse/{issue.key}\n\n"
+                fields_raw = issue.raw['fields']
+                parts.append(
+                    f"• **{issue.key}** - {fields_raw.get('summary')}\n"
+                    f"  Status: {fields_raw['status']['name']} | "
+                    f"Assignee: {(fields_raw.get('assignee') or {}).get('displayName', 'Unassigned')}\n"
+                    f"  URL: {self._browse_url}{issue.key}\n\n"
                 )
             
-            return [TextContent(type="text", text=result_text)]
+            return [TextContent(type="text", text="".join(parts))]
             
         except Exception as e:
             return [TextContent(type="text", text=f"Error searching issues: {str(e)}")]
 
-    async def _create_issue(self, project_key: str, issue_type: str, summary: str,
+    def _create_issue(self, project_key: str, issue_type: str, summary: str,
                           description: str, priority: str = "Normal", due_date: str = None,
                           epic_name: str = None) -> List[TextContent]:
         """Create a new Jira issue"""
@@ -765,19 +1191,7 @@ class JiraMCPServer:
             # Handle Epic Name for Epic issue types
             if issue_type.lower() == 'epic':
                 # Find the Epic Name custom field
-                all_fields = self.jira_client.fields()
-                epic_name_field = None
-                for field in all_fields:
-                    if field.get('name', '').lower() == 'epic name':
-                        epic_name_field = field['id']
-                        break
-
-                # Fallback to common epic name field IDs
-                if not epic_name_field:
-                    for candidate in ['customfield_12311141', 'customfield_10011', 'customfield_10004']:
-                        # We can't easily check if the field exists without trying, so just use the first candidate
-                        epic_name_field = candidate
-                        break
+                epic_name_field = self._epic_name_field_id(project_key)
 
                 # Use provided epic_name or fall back to summary
                 epic_name_value = epic_name if epic_name else summary
@@ -794,14 +1208,106 @@ class JiraMCPServer:
                    f"**Summary:** {summary}\n"
                    f"**Type:** {issue_type}{epic_name_text}\n"
                    f"**Priority:** {priority}{due_date_text}\n"
-                   f"**URL:** {self.jira_client.server_url}/browse/{new_issue.key}")
+                   f"**URL:** {self._browse_url}{new_issue.key}")
 
             return [TextContent(type="text", text=text)]
 
         except Exception as e:
             return [TextContent(type="text", text=f"Error creating issue: {str(e)}")]
 
-    async def _update_issue(self, issue_key: str, summary: Optional[str] = None,
+    def _epic_name_field_id(self, project_key: str) -> Optional[str]:
+        """Return the Epic Name field ID to set when creating an epic in a project.
+
+        Uses the field catalog when it has an 'Epic Name' field, otherwise asks
+        the project's create metadata for the epic label field (cached per
+        project). Returns None when the project's epics have no such field,
+        or, without caching, when the create metadata cannot be read.
+        """
+        self._get_fields()
+        epic_name_field = self._field_id_by_name.get('epic name')
+        if epic_name_field:
+            return epic_name_field
+
+        try:
+            return self._cached_meta('epic_name_field', project_key,
+                                     lambda: self._discover_epic_name_field(project_key))
+        except Exception as e:
+            logger.warning(f"Could not read create metadata for {project_key}: {e}")
+            return None
+
+    def _discover_epic_name_field(self, project_key: str) -> Optional[str]:
+        """Find the epic label field in a project's create metadata for epics"""
+        def is_epic_label(field: dict) -> bool:
+            return field.get('schema', {}).get('custom', '').endswith(':gh-epic-label')
+
+        client = self.jira_client
+        if not getattr(client, '_is_cloud', False) and getattr(client, '_version', (0,)) >= (8, 4, 0):
+            # The combined createmeta endpoint is deprecated in 8.4 and removed in 9.0
+            epic_type = next((issue_type for issue_type in client.project_issue_types(project_key, maxResults=False)
+                              if issue_type.name.lower() == 'epic'), None)
+            if epic_type is None:
+                return None
+            fields = client.project_issue_fields(project_key, epic_type.id, maxResults=False)
+            return next((field.raw['fieldId'] for field in fields if is_epic_label(field.raw)), None)
+
+        meta = client.createmeta(projectKeys=project_key, issuetypeNames='Epic',
+                                 expand='projects.issuetypes.fields')
+        for project in meta.get('projects', []):
+            for issue_type in project.get('issuetypes', []):
+                for field_id, field in issue_type.get('fields', {}).items():
+                    if is_epic_label(field):
+                        return field_id
+        return None
+
+    def _get_security_levels(self, issue_key: str) -> Tuple[Dict[str, str], str]:
+        """Return a name/ID -> ID lookup of the security levels allowed on an issue,
+        and the formatted list of those levels for error messages.
+
+        Levels are read from the issue's editmeta and cached per project.
+        """
+        def fetch():
+            issue_meta = self.jira_client._get_json(f'issue/{issue_key}/editmeta')
+            security_levels = issue_meta.get('fields', {}).get('security', {}).get('allowedValues', [])
+            security_level_ids = {}
+            for level in security_levels:
+                level_id = str(level.get('id'))
+                security_level_ids.setdefault(level.get('name'), level_id)
+                security_level_ids.setdefault(level_id, level_id)
+            available_levels = "\n".join(f"{level.get('name')} (ID: {level.get('id')})"
+                                          for level in security_levels)
+            return security_level_ids, available_levels
+
+        project_key = issue_key.rsplit('-', 1)[0]
+        return self._cached_meta('security_levels', project_key, fetch)
+
+    def _resolve_assignee_email(self, email: str) -> Optional[dict]:
+        """Resolve an email address to an assignee reference, caching successful lookups"""
+        cache_key = email.lower()
+        with self._cache_lock:
+            assignee_ref = self._assignee_cache.get(cache_key)
+        if assignee_ref is not None:
+            return assignee_ref
+
+        users = self.jira_client.search_users(email)
+        if not users:
+            return None
+        user = users[0]
+        # Try to get accountId first, fall back to name
+        account_id = getattr(user, 'accountId', _MISSING)
+        user_name = getattr(user, 'name', _MISSING)
+        if account_id is not _MISSING:
+            assignee_ref = {'accountId': account_id}
+        elif user_name is not _MISSING:
+            assignee_ref = {'name': user_name}
+        else:
+            # Last resort - try to use the key attribute
+            user_key = getattr(user, 'key', _MISSING)
+            assignee_ref = {'name': user_key if user_key is not _MISSING else str(user)}
+        with self._cache_lock:
+            self._assignee_cache[cache_key] = assignee_ref
+        return assignee_ref
+
+    def _update_issue(self, issue_key: str, summary: Optional[str] = None,
                           description: Optional[str] = None, story_points: Optional[float] = None,
                           priority: Optional[str] = None, assignee: Optional[str] = None,
                           security_level: Optional[str] = None) -> List[TextContent]:
@@ -822,54 +1328,30 @@ class JiraMCPServer:
                 # Handle special values for current user
                 if assignee.lower() in ['me', 'myself']:
                     # Get current user's account ID
-                    current_user = self.jira_client.current_user()
-                    update_dict['assignee'] = {'name': current_user}
+                    current_user = self.current_user
+                    update_dict['assignee'] = {self.assignee_key: current_user}
                 elif assignee == '':
                     # Empty string means unassign
                     update_dict['assignee'] = None
                 elif '@' in assignee:
                     # Treat as email - need to search for user by email
                     try:
-                        users = self.jira_client.search_users(assignee)
-                        if users:
-                            user = users[0]
-                            # Try to get accountId first, fall back to name
-                            if hasattr(user, 'accountId'):
-                                update_dict['assignee'] = {'accountId': user.accountId}
-                            elif hasattr(user, 'name'):
-                                update_dict['assignee'] = {'name': user.name}
-                            else:
-                                # Last resort - try to use the key attribute
-                                update_dict['assignee'] = {'name': user.key if hasattr(user, 'key') else str(user)}
+                        assignee_ref = self._resolve_assignee_email(assignee)
+                        if assignee_ref:
+                            update_dict['assignee'] = assignee_ref
                         else:
                             return [TextContent(type="text", text=f"Error: User with email '{assignee}' not found")]
                     except Exception as e:
                         return [TextContent(type="text", text=f"Error searching for user: {str(e)}")]
                 else:
-                    # Assume it's an account ID or username
-                    # Try accountId first, if that fails the error will indicate to use name
-                    try:
-                        update_dict['assignee'] = {'accountId': assignee}
-                    except:
-                        update_dict['assignee'] = {'name': assignee}
+                    # Assume it's an account ID (Cloud) or username (Server/Data Center)
+                    update_dict['assignee'] = {self.assignee_key: assignee}
 
             # Handle story points - need to find the custom field ID
             if story_points is not None:
-                # Try common story point field names
-                story_point_field = None
-                all_fields = self.jira_client.fields()
-                for field in all_fields:
-                    if field.get('name', '').lower() in ['story points', 'story point estimate']:
-                        story_point_field = field['id']
-                        break
-
                 # Fallback to common custom field IDs if not found by name
-                if not story_point_field:
-                    # Try the most common custom field IDs for story points
-                    for candidate in ['customfield_10016', 'customfield_10026', 'customfield_10004']:
-                        if hasattr(issue.fields, candidate):
-                            story_point_field = candidate
-                            break
+                story_point_field = self.story_points_field_id or self._first_present_field(
+                    issue, STORY_POINTS_FIELD_CANDIDATES)
 
                 if story_point_field:
                     update_dict[story_point_field] = story_points
@@ -884,30 +1366,17 @@ class JiraMCPServer:
                 else:
                     # Try to find the security level by name or use it as ID directly
                     try:
-                        # Get issue metadata which includes security levels
-                        issue_meta = self.jira_client._get_json(f'issue/{issue_key}/editmeta')
-
-                        security_levels = []
-                        if 'fields' in issue_meta and 'security' in issue_meta['fields']:
-                            allowed_values = issue_meta['fields']['security'].get('allowedValues', [])
-                            security_levels = allowed_values
-
-                        # Try to find by name first
-                        security_level_id = None
-                        for level in security_levels:
-                            if level.get('name') == security_level or str(level.get('id')) == security_level:
-                                security_level_id = str(level.get('id'))
-                                break
+                        security_level_ids, available_levels = self._get_security_levels(issue_key)
+                        security_level_id = security_level_ids.get(security_level)
 
                         if security_level_id:
                             # Set the security level using the ID
                             update_dict['security'] = {'id': security_level_id}
                         else:
                             # If not found, list available levels
-                            if security_levels:
-                                available_levels = [f"{level.get('name')} (ID: {level.get('id')})" for level in security_levels]
+                            if available_levels:
                                 return [TextContent(type="text",
-                                       text=f"Error: Security level '{security_level}' not found.\nAvailable levels:\n" + "\n".join(available_levels))]
+                                       text=f"Error: Security level '{security_level}' not found.\nAvailable levels:\n" + available_levels)]
                             else:
                                 return [TextContent(type="text",
                                        text=f"Error: No security levels available for this issue or project")]
@@ -918,6 +1387,7 @@ class JiraMCPServer:
                 return [TextContent(type="text", text="No fields specified for update.")]
 
             issue.update(fields=update_dict)
+            self._invalidate_issue(issue_key, issue.key)
 
             updates = []
             if summary:
@@ -943,14 +1413,14 @@ class JiraMCPServer:
 
             text = (f"**Issue {issue_key} updated successfully!**\n\n"
                    f"**Updated fields:** {', '.join(updates)}\n"
-                   f"**URL:** {self.jira_client.server_url}/browse/{issue_key}")
+                   f"**URL:** {self._browse_url}{issue_key}")
 
             return [TextContent(type="text", text=text)]
 
         except Exception as e:
             return [TextContent(type="text", text=f"Error updating issue {issue_key}: {str(e)}")]
 
-    async def _add_comment(self, issue_key: str, comment: str, security_level: Optional[str] = None) -> List[TextContent]:
+    def _add_comment(self, issue_key: str, comment: str, security_level: Optional[str] = None) -> List[TextContent]:
         """Add a comment to an issue"""
         try:
             # Prepare comment data
@@ -960,21 +1430,8 @@ class JiraMCPServer:
             if security_level:
                 # Try to find the security level by name or use it as ID directly
                 try:
-                    # Get issue metadata which includes security levels
-                    # Use the REST API endpoint to get security levels
-                    issue_meta = self.jira_client._get_json(f'issue/{issue_key}/editmeta')
-
-                    security_levels = []
-                    if 'fields' in issue_meta and 'security' in issue_meta['fields']:
-                        allowed_values = issue_meta['fields']['security'].get('allowedValues', [])
-                        security_levels = allowed_values
-
-                    # Try to find by name first
-                    security_level_id = None
-                    for level in security_levels:
-                        if level.get('name') == security_level or str(level.get('id')) == security_level:
-                            security_level_id = str(level.get('id'))
-                            break
+                    security_level_ids, available_levels = self._get_security_levels(issue_key)
+                    security_level_id = security_level_ids.get(security_level)
 
                     if security_level_id:
                         # Add visibility to the comment data using the security level name
@@ -984,10 +1441,9 @@ class JiraMCPServer:
                         }
                     else:
                         # If not found, list available levels
-                        if security_levels:
-                            available_levels = [f"{level.get('name')} (ID: {level.get('id')})" for level in security_levels]
+                        if available_levels:
                             return [TextContent(type="text",
-                                   text=f"Error: Security level '{security_level}' not found.\nAvailable levels:\n" + "\n".join(available_levels))]
+                                   text=f"Error: Security level '{security_level}' not found.\nAvailable levels:\n" + available_levels)]
                         else:
                             return [TextContent(type="text",
                                    text=f"Error: No security levels available for this issue or project")]
@@ -995,23 +1451,23 @@ class JiraMCPServer:
                     return [TextContent(type="text", text=f"Error processing security level: {str(e)}")]
 
             # Add the comment using the REST API directly
-            url = f'issue/{issue_key}/comment'
             self.jira_client._session.post(
-                self.jira_client._get_url(url),
+                self._comment_url_template.format(issue_key),
                 json=comment_data
             )
+            self._invalidate_issue(issue_key)
 
             security_text = f"\n**Security Level:** {security_level}" if security_level else ""
             text = (f"**Comment added to {issue_key} successfully!**\n\n"
                    f"**Comment:** {comment}{security_text}\n"
-                   f"**URL:** {self.jira_client.server_url}/browse/{issue_key}")
+                   f"**URL:** {self._browse_url}{issue_key}")
 
             return [TextContent(type="text", text=text)]
 
         except Exception as e:
             return [TextContent(type="text", text=f"Error adding comment to {issue_key}: {str(e)}")]
 
-    async def _get_comments(self, issue_key: str) -> List[TextContent]:
+    def _get_comments(self, issue_key: str) -> List[TextContent]:
         """Get all comments for an issue"""
         try:
             issue = self.jira_client.issue(issue_key)
@@ -1020,34 +1476,40 @@ class JiraMCPServer:
             if not comments:
                 return [TextContent(type="text", text=f"No comments found for issue {issue_key}.")]
             
-            result_text = f"**Comments for {issue_key}:**\n\n"
+            parts = [f"**Comments for {issue_key}:**\n\n"]
             
             for comment in comments:
-                result_text += (
+                parts.append(
                     f"**{comment.author.displayName}** - {comment.created}\n"
                     f"{comment.body}\n"
                     f"---\n\n"
                 )
             
-            return [TextContent(type="text", text=result_text)]
+            return [TextContent(type="text", text="".join(parts))]
             
         except Exception as e:
             return [TextContent(type="text", text=f"Error fetching comments for {issue_key}: {str(e)}")]
 
-    async def _transition_issue(self, issue_key: str, transition_name: str) -> List[TextContent]:
+    def _transition_issue(self, issue_key: str, transition_name: str) -> List[TextContent]:
         """Transition an issue to a new status"""
         try:
-            issue = self.jira_client.issue(issue_key)
-            transitions = self.jira_client.transitions(issue)
+            # Fetch the available transitions along with the issue in one request
+            issue = self.jira_client.issue(issue_key, fields='status', expand='transitions')
+            transitions = issue.raw.get('transitions', [])
             
             # Find the transition by name
             transition_id = None
+            new_status = None
             available_transitions = []
+            target_name = transition_name.lower()
             
             for transition in transitions:
                 available_transitions.append(transition['name'])
-                if transition['name'].lower() == transition_name.lower():
+                if transition['name'].lower() == target_name:
                     transition_id = transition['id']
+                    # The transition carries its target status, so the issue
+                    # does not need to be refetched to report it
+                    new_status = transition.get('to', {}).get('name') or transition['name']
                     break
             
             if not transition_id:
@@ -1056,29 +1518,28 @@ class JiraMCPServer:
                 return [TextContent(type="text", text=text)]
             
             self.jira_client.transition_issue(issue, transition_id)
-            
-            # Get updated issue to show new status
-            updated_issue = self.jira_client.issue(issue_key)
+            self._invalidate_issue(issue_key, issue.key)
             
             text = (f"**Issue {issue_key} transitioned successfully!**\n\n"
-                   f"**New Status:** {updated_issue.fields.status.name}\n"
-                   f"**URL:** {self.jira_client.server_url}/browse/{issue_key}")
+                   f"**New Status:** {new_status}\n"
+                   f"**URL:** {self._browse_url}{issue_key}")
             
             return [TextContent(type="text", text=text)]
             
         except Exception as e:
             return [TextContent(type="text", text=f"Error transitioning issue {issue_key}: {str(e)}")]
 
-    async def _get_project(self, project_key: str) -> List[TextContent]:
+    def _get_project(self, project_key: str) -> List[TextContent]:
         """Get information about a project"""
         try:
-            project = self.jira_client.project(project_key)
+            project = self._fetch_project(project_key)
+            lead = getattr(project, 'lead', None)
             
             project_data = {
                 "key": project.key,
                 "name": project.name,
                 "description": getattr(project, 'description', 'No description'),
-                "lead": project.lead.displayName if hasattr(project, 'lead') and project.lead else "No lead",
+                "lead": lead.displayName if lead else "No lead",
                 "project_type": getattr(project, 'projectTypeKey', 'Unknown'),
                 "url": f"{self.jira_client.server_url}/projects/{project.key}"
             }
@@ -1095,126 +1556,269 @@ class JiraMCPServer:
         except Exception as e:
             return [TextContent(type="text", text=f"Error fetching project {project_key}: {str(e)}")]
 
-    async def _get_issue_types(self, project_key: str) -> List[TextContent]:
+    def _get_issue_types(self, project_key: str) -> List[TextContent]:
         """Get available issue types for a project"""
         try:
-            project = self.jira_client.project(project_key)
-            issue_types = project.issueTypes
+            issue_types = self._cached_meta('issue_types', project_key,
+                                            lambda: self._fetch_project(project_key).issueTypes)
             
             if not issue_types:
                 return [TextContent(type="text", text=f"No issue types found for project {project_key}.")]
             
-            result_text = f"**Issue types for project {project_key}:**\n\n"
+            parts = [f"**Issue types for project {project_key}:**\n\n"]
             
             for issue_type in issue_types:
-                result_text += f"• **{issue_type.name}**"
-                if hasattr(issue_type, 'description') and issue_type.description:
-                    result_text += f" - {issue_type.description}"
-                result_text += "\n"
+                description = getattr(issue_type, 'description', None)
+                if description:
+                    parts.append(f"• **{issue_type.name}** - {description}\n")
+                else:
+                    parts.append(f"• **{issue_type.name}**\n")
             
-            return [TextContent(type="text", text=result_text)]
+            return [TextContent(type="text", text="".join(parts))]
             
         except Exception as e:
             return [TextContent(type="text", text=f"Error fetching issue types for {project_key}: {str(e)}")]
 
-    async def _get_my_issues(self, max_results: int = 20) -> List[TextContent]:
+    def _get_my_issues(self, max_results: int = 20) -> List[TextContent]:
         """Get issues assigned to the current user"""
         try:
             jql = "assignee = currentUser() ORDER BY updated DESC"
-            issues = self.jira_client.search_issues(jql, maxResults=max_results)
+            issues = self._search_issue_list(jql, max_results, 'summary,status,priority')
             
             if not issues:
                 return [TextContent(type="text", text="No issues assigned to you found.")]
             
-            result_text = f"**Your assigned issues ({len(issues)}):**\n\n"
+            parts = [f"**Your assigned issues ({len(issues)}):**\n\n"]
             
             for issue in issues:
-                result_text += (
-                    f"• **{issue.key}** - {issue.fields.summary}\n"
-                    f"  Status: {issue.fields.status.name} | "
-                    f"Priority: {issue.fields.priority.name if issue.fields.priority else 'None'}\n"
-                    f"  URL: {self.jira_client.server_url}/browse/{issue.key}\n\n"
+                fields_raw = issue.raw['fields']
+                parts.append(
+                    f"• **{issue.key}** - {fields_raw.get('summary')}\n"
+                    f"  Status: {fields_raw['status']['name']} | "
+                    f"Priority: {(fields_raw.get('priority') or {}).get('name', 'None')}\n"
+                    f"  URL: {self._browse_url}{issue.key}\n\n"
                 )
             
-            return [TextContent(type="text", text=result_text)]
+            return [TextContent(type="text", text="".join(parts))]
             
         except Exception as e:
             return [TextContent(type="text", text=f"Error fetching your issues: {str(e)}")]
 
-    async def _get_project_issues(self, project_key: str, max_results: int = 50) -> List[TextContent]:
+    def _get_project_issues(self, project_key: str, max_results: int = 50,
+                                  batch_size: Optional[int] = None) -> List[TextContent]:
         """Get all issues for a specific project"""
         try:
             jql = f"project = {project_key} ORDER BY updated DESC"
-            issues = self.jira_client.search_issues(jql, maxResults=max_results)
+            issues = self._search_issue_list(jql, max_results, 'summary,status,assignee', batch_size)
 
             if not issues:
                 return [TextContent(type="text", text=f"No issues found for project {project_key}.")]
 
-            result_text = f"**Issues in project {project_key} ({len(issues)}):**\n\n"
+            parts = [f"**Issues in project {project_key} ({len(issues)}):**\n\n"]
 
             for issue in issues:
-                result_text += (
-                    f"• **{issue.key}** - {issue.fields.summary}\n"
-                    f"  Status: {issue.fields.status.name} | "
-                    f"Assignee: {issue.fields.assignee.displayName if issue.fields.assignee else 'Unassigned'}\n"
-                    f"  URL: {self.jira_client.server_url}/browse/{issue.key}\n\n"
+                fields_raw = issue.raw['fields']
+                parts.append(
+                    f"• **{issue.key}** - {fields_raw.get('summary')}\n"
+                    f"  Status: {fields_raw['status']['name']} | "
+                    f"Assignee: {(fields_raw.get('assignee') or {}).get('displayName', 'Unassigned')}\n"
+                    f"  URL: {self._browse_url}{issue.key}\n\n"
                 )
 
-            return [TextContent(type="text", text=result_text)]
+            return [TextContent(type="text", text="".join(parts))]
 
         except Exception as e:
             return [TextContent(type="text", text=f"Error fetching project issues: {str(e)}")]
 
-    def _get_all_boards(self) -> list:
-        """Fetch all boards, handling pagination."""
-        all_boards = []
+    @staticmethod
+    def _fetch_all_pages(fetch, page_size: int = PAGE_SIZE) -> list:
+        """Fetch every page of a paginated Jira resource.
+
+        fetch(start_at, max_results) must return a ResultList. The first page
+        is fetched alone to learn the total, then the remaining pages are
+        fetched concurrently. Falls back to sequential paging when the server
+        does not report a total.
+        """
+        first = fetch(0, page_size)
+        items = list(first)
+        total = getattr(first, 'total', None)
+
+        if total is not None and total > len(items) > 0:
+            # The server may cap the page size below what was requested
+            step = len(items)
+
+            def fetch_page(start_at):
+                with _PAGE_FETCH_SLOTS:
+                    return fetch(start_at, step)
+
+            # map() yields pages in request order, so items keep the server's ordering
+            with ThreadPoolExecutor(max_workers=PAGINATION_WORKERS) as executor:
+                for batch in executor.map(fetch_page, range(step, total, step)):
+                    items.extend(batch)
+            return items
+
+        # No usable total: page sequentially until a short page comes back
+        return list(JiraMCPServer._iter_pages(fetch, page_size, first=first))
+
+    @staticmethod
+    def _iter_pages(fetch, page_size: int = PAGE_SIZE, first=None):
+        """Yield the items of a paginated Jira resource, fetching each page only
+        once the previous one has been consumed, so callers can stop early.
+
+        fetch(start_at, max_results) must return a ResultList; `first` may be
+        an already fetched first page.
+        """
+        batch = first if first is not None else fetch(0, page_size)
+        if batch and getattr(batch, 'isLast', None) is False:
+            # The server may cap the page size below what was requested
+            page_size = min(page_size, len(batch))
         start_at = 0
-        max_results = 50
         while True:
-            batch = self.jira_client.boards(startAt=start_at, maxResults=max_results)
-            if not batch:
-                break
-            all_boards.extend(batch)
-            if len(batch) < max_results:
-                break
+            yield from batch
             start_at += len(batch)
-        return all_boards
+            if not batch or len(batch) < page_size or getattr(batch, 'isLast', False):
+                return
+            batch = fetch(start_at, page_size)
+
+    def _search_all_issues(self, jql: str, fields: str = '*all',
+                           expand: Optional[str] = None, validate_query: bool = True) -> list:
+        """Fetch all issues matching a JQL query on Jira Server/DC, paging concurrently.
+
+        Offset-based paging is not available for Cloud search, which pages by token.
+        """
+        return self._fetch_all_pages(
+            lambda start_at, max_results: self.jira_client.search_issues(
+                jql, startAt=start_at, maxResults=max_results, validate_query=validate_query,
+                fields=fields, expand=expand),
+            page_size=self._page_size)
+
+    def _iter_search_pages(self, jql: str, fields: str = '*all',
+                           expand: Optional[str] = None, validate_query: bool = True,
+                           max_results: Optional[int] = None, page_size: Optional[int] = None):
+        """Yield the issues matching a JQL query one page at a time.
+
+        The next page is requested in the background while the caller works
+        on the current one, so at most two pages are held in memory. Stops
+        after max_results issues when given.
+        """
+        page_size = page_size or self._page_size
+        if getattr(self.jira_client, '_is_cloud', False):
+            # Jira Cloud pages search results by token rather than offset
+            def fetch(token, count):
+                with _PAGE_FETCH_SLOTS:
+                    page = self.jira_client.enhanced_search_issues(
+                        jql, nextPageToken=token, maxResults=count,
+                        fields=fields, expand=expand)
+                return list(page), page.nextPageToken or None
+            cursor = ''
+        else:
+            def fetch(start_at, count):
+                with _PAGE_FETCH_SLOTS:
+                    page = self.jira_client.search_issues(
+                        jql, startAt=start_at, maxResults=count,
+                        validate_query=validate_query, fields=fields, expand=expand)
+                next_start = start_at + len(page)
+                if not page or page.isLast or next_start >= page.total:
+                    next_start = None
+                return list(page), next_start
+            cursor = 0
+
+        remaining = max_results if max_results is not None else float('inf')
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(fetch, cursor, min(page_size, remaining))
+            while future is not None:
+                page, cursor = future.result()
+                remaining -= len(page)
+                future = None
+                if cursor is not None and remaining > 0:
+                    future = executor.submit(fetch, cursor, min(page_size, remaining))
+                yield page
+
+    def _search_issue_list(self, jql: str, max_results: int, fields: str,
+                           batch_size: Optional[int] = None) -> list:
+        """Fetch up to max_results issues matching a JQL query, batch_size per request"""
+        return list(itertools.chain.from_iterable(self._iter_search_pages(
+            jql, fields=fields, max_results=max_results, page_size=batch_size)))
+
+    def _get_all_boards(self) -> list:
+        """Fetch all boards, handling pagination. The list is cached like project metadata."""
+        return self._cached_meta('boards', '', lambda: self._fetch_all_pages(
+            lambda start_at, max_results: self.jira_client.boards(
+                startAt=start_at, maxResults=max_results),
+            page_size=self._page_size))
 
     def _get_all_sprints(self, board_id: int, state: Optional[str] = None) -> list:
         """Fetch all sprints from a board, handling pagination."""
-        all_sprints = []
-        start_at = 0
-        max_results = 50
-        while True:
-            batch = self.jira_client.sprints(board_id, startAt=start_at, maxResults=max_results, state=state)
-            if not batch:
-                break
-            all_sprints.extend(batch)
-            if len(batch) < max_results:
-                break
-            start_at += len(batch)
-        return all_sprints
+        return self._fetch_all_pages(
+            lambda start_at, max_results: self.jira_client.sprints(
+                board_id, startAt=start_at, maxResults=max_results, state=state),
+            page_size=self._page_size)
+
+    def _find_sprint_on_board(self, board_id: int, sprint_name: str):
+        """Find a sprint by name on one board, paging only until it is found.
+
+        Active and future sprints are searched before the usually much longer
+        list of closed sprints.
+        """
+        for state in ('active,future', 'closed'):
+            sprints = self._iter_pages(
+                lambda start_at, max_results: self.jira_client.sprints(
+                    board_id, startAt=start_at, maxResults=max_results, state=state),
+                page_size=self._page_size)
+            sprint = next((sprint for sprint in sprints if sprint.name == sprint_name), None)
+            if sprint is not None:
+                return sprint
+        return None
 
-    async def _set_sprint(self, issue_key: str, sprint_option: str,
+    def _find_sprint_on_boards(self, sprint_name: str) -> tuple:
+        """Find a sprint by name across all boards. Returns (sprint, board_id), or (None, None).
+
+        Boards are searched concurrently but checked in board order, so the
+        first board with a matching sprint wins as with a sequential scan.
+        Boards whose sprints cannot be fetched are skipped. The sprint id and
+        board of a match are remembered by name so repeated lookups skip the
+        board scan; the sprint itself is re-read so its state is current.
+        """
+        with self._cache_lock:
+            cached = self._sprint_locations.get(sprint_name)
+        if cached and time.time() - cached[0] < META_CACHE_TTL:
+            _, sprint_id, board_id = cached
+            try:
+                sprint = self.jira_client.sprint(sprint_id)
+            except JIRAError:
+                sprint = None
+            if sprint is not None and sprint.name == sprint_name:
+                return sprint, board_id
+            with self._cache_lock:
+                self._sprint_locations.pop(sprint_name, None)
+        boards = self._get_all_boards()
+        executor = ThreadPoolExecutor(max_workers=PAGINATION_WORKERS)
+        try:
+            futures = [(board.id, executor.submit(self._find_sprint_on_board, board.id, sprint_name))
+                       for board in boards]
+            for board_id, future in futures:
+                try:
+                    sprint = future.result()
+                except Exception:
+                    continue
+                if sprint is not None:
+                    with self._cache_lock:
+                        self._sprint_locations[sprint_name] = (time.time(), sprint.id, board_id)
+                    return sprint, board_id
+            return None, None
+        finally:
+            # Don't wait on lookups for boards after the match
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _set_sprint(self, issue_key: str, sprint_option: str,
                          sprint_value: Optional[str] = None, board_id: Optional[int] = None) -> List[TextContent]:
         """Set the sprint for a Jira issue"""
         try:
             issue = self.jira_client.issue(issue_key)
 
-            # Find the sprint field
-            all_fields = self.jira_client.fields()
-            sprint_field = None
-            for field in all_fields:
-                if field.get('name', '').lower() == 'sprint':
-                    sprint_field = field['id']
-                    break
-
-            # Fallback to common sprint field IDs
-            if not sprint_field:
-                for candidate in ['customfield_12310940', 'customfield_10020', 'customfield_10010']:
-                    if hasattr(issue.fields, candidate):
-                        sprint_field = candidate
-                        break
+            # Find the sprint field, falling back to common sprint field IDs
+            sprint_field = self.sprint_field_id or self._first_present_field(
+                issue, SPRINT_FIELD_CANDIDATES)
 
             if not sprint_field:
                 return [TextContent(type="text", text=f"Error: Could not find sprint field for issue {issue_key}")]
@@ -1224,9 +1828,10 @@ class JiraMCPServer:
                 try:
                     # Set sprint field to None/empty
                     issue.update(fields={sprint_field: None})
+                    self._invalidate_issue(issue_key, issue.key)
 
                     text = (f"**Sprint removed successfully from {issue_key}!**\n\n"
-                           f"**URL:** {self.jira_client.server_url}/browse/{issue_key}")
+                           f"**URL:** {self._browse_url}{issue_key}")
 
                     return [TextContent(type="text", text=text)]
 
@@ -1237,7 +1842,9 @@ class JiraMCPServer:
             if not board_id:
                 # Try to find the board from the issue's project
                 try:
-                    boards = self.jira_client.boards(projectKeyOrId=issue.fields.project.key)
+                    # Only the first board is used, so don't page through the rest
+                    boards = self.jira_client.boards(startAt=0, maxResults=1,
+                                                     projectKeyOrID=issue.fields.project.key)
                     if boards:
                         board_id = boards[0].id
                     else:
@@ -1245,13 +1852,19 @@ class JiraMCPServer:
                 except Exception as e:
                     return [TextContent(type="text", text=f"Error finding board: {str(e)}")]
 
-            # Get sprints from the board (paginated)
+            # Get sprints from the board, letting the server filter by state
+            # where only active or future sprints are of interest
             try:
-                sprints = self._get_all_sprints(board_id)
+                if sprint_option == "current":
+                    sprints = self.jira_client.sprints(board_id, startAt=0, maxResults=1, state='active')
+                elif sprint_option == "next":
+                    sprints = self._get_all_sprints(board_id, state='future')
+                else:
+                    sprints = self._get_all_sprints(board_id)
             except Exception as e:
                 return [TextContent(type="text", text=f"Error fetching sprints: {str(e)}")]
 
-            if not sprints:
+            if not sprints and sprint_option not in ("current", "next"):
                 return [TextContent(type="text", text=f"Error: No sprints found for board {board_id}")]
 
             # Select the appropriate sprint based on the option
@@ -1267,13 +1880,14 @@ class JiraMCPServer:
                     return [TextContent(type="text", text="Error: No active sprint found")]
 
             elif sprint_option == "next":
-                # Find the next future sprint
-                future_sprints = [s for s in sprints if s.state == 'future']
-                if future_sprints:
-                    # Sort by start date or ID and get the first one
-                    future_sprints.sort(key=lambda s: s.id)
-                    selected_sprint = future_sprints[0]
-                else:
+                # Find the next future sprint: earliest start date first, then
+                # sprints without a start date in creation (ID) order
+                selected_sprint = min(
+                    (s for s in sprints if s.state == 'future'),
+                    key=lambda s: (getattr(s, 'startDate', None) is None,
+                                   getattr(s, 'startDate', None) or '', s.id),
+                    default=None)
+                if selected_sprint is None:
                     return [TextContent(type="text", text="Error: No future sprint found")]
 
             elif sprint_option == "specific":
@@ -1298,12 +1912,13 @@ class JiraMCPServer:
             # Set the sprint using the Jira Python module
             try:
                 self.jira_client.add_issues_to_sprint(selected_sprint.id, [issue_key])
+                self._invalidate_issue(issue_key, issue.key)
 
                 text = (f"**Sprint set successfully for {issue_key}!**\n\n"
                        f"**Sprint:** {selected_sprint.name}\n"
                        f"**Sprint ID:** {selected_sprint.id}\n"
                        f"**Sprint State:** {selected_sprint.state}\n"
-                       f"**URL:** {self.jira_client.server_url}/browse/{issue_key}")
+                       f"**URL:** {self._browse_url}{issue_key}")
 
                 return [TextContent(type="text", text=text)]
 
@@ -1313,26 +1928,20 @@ class JiraMCPServer:
         except Exception as e:
             return [TextContent(type="text", text=f"Error setting sprint for {issue_key}: {str(e)}")]
 
-    async def _set_epic_link(self, issue_key: str, epic_key: Optional[str] = None) -> List[TextContent]:
+    def _set_epic_link(self, issue_key: str, epic_key: Optional[str] = None) -> List[TextContent]:
         """Set or remove the epic link for a Jira issue"""
         try:
-            issue = self.jira_client.issue(issue_key)
-
-            # Find the Epic Link custom field
-            all_fields = self.jira_client.fields()
-            epic_link_field = None
-            for field in all_fields:
-                if field.get('name', '').lower() == 'epic link':
-                    epic_link_field = field['id']
-                    break
+            # Only the Epic Link field is needed from the issue
+            epic_link_field = self.epic_link_field_id
+            issue = self.jira_client.issue(
+                issue_key, fields=epic_link_field or ','.join(EPIC_LINK_FIELD_CANDIDATES))
 
-            # Fallback to common epic link field IDs
+            # Fall back to common epic link field IDs, remembering the one found
             if not epic_link_field:
-                for candidate in ['customfield_12311140', 'customfield_10014', 'customfield_10008']:
-                    # Try to find if this field exists in the issue
-                    if hasattr(issue.fields, candidate):
-                        epic_link_field = candidate
-                        break
+                epic_link_field = self._first_present_field(issue, EPIC_LINK_FIELD_CANDIDATES)
+                if epic_link_field:
+                    logger.info(f"No 'Epic Link' field in the field catalog; using {epic_link_field}")
+                self._epic_link_field_id = epic_link_field
 
             if not epic_link_field:
                 return [TextContent(type="text", text=f"Error: Could not find Epic Link field for issue {issue_key}")]
@@ -1341,9 +1950,10 @@ class JiraMCPServer:
             if not epic_key or epic_key == "":
                 try:
                     issue.update(fields={epic_link_field: None})
+                    self._invalidate_issue(issue_key, issue.key)
 
                     text = (f"**Epic link removed successfully from {issue_key}!**\n\n"
-                           f"**URL:** {self.jira_client.server_url}/browse/{issue_key}")
+                           f"**URL:** {self._browse_url}{issue_key}")
 
                     return [TextContent(type="text", text=text)]
 
@@ -1352,20 +1962,22 @@ class JiraMCPServer:
 
             # Verify the epic exists
             try:
-                epic = self.jira_client.issue(epic_key)
-                if epic.fields.issuetype.name.lower() != 'epic':
-                    return [TextContent(type="text", text=f"Error: {epic_key} is not an Epic (type: {epic.fields.issuetype.name})")]
+                epic = self.jira_client.issue(epic_key, fields='summary,issuetype')
+                epic_type = epic.fields.issuetype.name
+                if epic_type.lower() != 'epic':
+                    return [TextContent(type="text", text=f"Error: {epic_key} is not an Epic (type: {epic_type})")]
             except Exception as e:
                 return [TextContent(type="text", text=f"Error: Could not find epic {epic_key}: {str(e)}")]
 
             # Set the epic link
             try:
                 issue.update(fields={epic_link_field: epic_key})
+                self._invalidate_issue(issue_key, issue.key)
 
                 text = (f"**Epic link set successfully for {issue_key}!**\n\n"
                        f"**Epic:** {epic_key} - {epic.fields.summary}\n"
-                       f"**Issue URL:** {self.jira_client.server_url}/browse/{issue_key}\n"
-                       f"**Epic URL:** {self.jira_client.server_url}/browse/{epic_key}")
+                       f"**Issue URL:** {self._browse_url}{issue_key}\n"
+                       f"**Epic URL:** {self._browse_url}{epic_key}")
 
                 return [TextContent(type="text", text=text)]
 
@@ -1375,36 +1987,37 @@ class JiraMCPServer:
         except Exception as e:
             return [TextContent(type="text", text=f"Error setting epic link for {issue_key}: {str(e)}")]
 
-    async def _get_components(self, project_key: str) -> List[TextContent]:
+    def _get_components(self, project_key: str) -> List[TextContent]:
         """Get available components for a project"""
         try:
-            project = self.jira_client.project(project_key)
-            components = self.jira_client.project_components(project)
+            components = self._fetch_components(project_key)
 
             if not components:
                 return [TextContent(type="text", text=f"No components found for project {project_key}.")]
 
-            result_text = f"**Components for project {project_key}:**\n\n"
+            parts = [f"**Components for project {project_key}:**\n\n"]
 
             for component in components:
-                result_text += f"• **{component.name}**"
-                if hasattr(component, 'description') and component.description:
-                    result_text += f" - {component.description}"
-                result_text += "\n"
+                description = getattr(component, 'description', None)
+                if description:
+                    parts.append(f"• **{component.name}** - {description}\n")
+                else:
+                    parts.append(f"• **{component.name}**\n")
 
-            return [TextContent(type="text", text=result_text)]
+            return [TextContent(type="text", text="".join(parts))]
 
         except Exception as e:
             return [TextContent(type="text", text=f"Error fetching components for {project_key}: {str(e)}")]
 
-    async def _set_components(self, issue_key: str, components: List[str]) -> List[TextContent]:
+    def _set_components(self, issue_key: str, components: List[str]) -> List[TextContent]:
         """Set components for a Jira issue"""
         try:
-            issue = self.jira_client.issue(issue_key)
+            # Only the project is needed to validate against its components
+            issue = self.jira_client.issue(issue_key, fields='project')
             project = issue.fields.project
 
             # Get available components for validation
-            available_components = self.jira_client.project_components(project)
+            available_components = self._fetch_components(project.key)
             available_component_names = {comp.name: comp for comp in available_components}
 
             # Validate that all requested components exist
@@ -1418,6 +2031,9 @@ class JiraMCPServer:
                     invalid_components.append(comp_name)
 
             if invalid_components:
+                # The cached list may predate a newly created component
+                with self._cache_lock:
+                    self._meta_cache.pop(('components', project.key), None)
                 available_list = ", ".join(available_component_names.keys())
                 return [TextContent(type="text",
                        text=f"Error: Invalid component(s): {', '.join(invalid_components)}\n\n"
@@ -1425,57 +2041,61 @@ class JiraMCPServer:
 
             # Update the issue with the new components
             issue.update(fields={'components': valid_components})
+            self._invalidate_issue(issue_key, issue.key)
 
             if components:
                 comp_list = ", ".join(components)
                 text = (f"**Components set successfully for {issue_key}!**\n\n"
                        f"**Components:** {comp_list}\n"
-                       f"**URL:** {self.jira_client.server_url}/browse/{issue_key}")
+                       f"**URL:** {self._browse_url}{issue_key}")
             else:
                 text = (f"**All components removed from {issue_key}!**\n\n"
-                       f"**URL:** {self.jira_client.server_url}/browse/{issue_key}")
+                       f"**URL:** {self._browse_url}{issue_key}")
 
             return [TextContent(type="text", text=text)]
 
         except Exception as e:
             return [TextContent(type="text", text=f"Error setting components for {issue_key}: {str(e)}")]
 
-    async def _get_issue_sprint_history(self, issue_key: str) -> List[TextContent]:
+    def _get_issue_sprint_history(self, issue_key: str) -> List[TextContent]:
         """Get the history of sprint changes for an issue"""
         try:
             if not self.jira_client:
                 return [TextContent(type="text", text="Jira client not initialized")]
 
             # Fetch issue with changelog expanded
-            issue = self.jira_client.issue(issue_key, expand='changelog')
+            issue = self._fetch_issue(issue_key, expand='changelog')
 
             sprint_changes = []
 
             # Iterate through changelog histories
             if hasattr(issue, 'changelog') and hasattr(issue.changelog, 'histories'):
                 for history in issue.changelog.histories:
+                    sprint_items = [item for item in history.items if item.field == 'Sprint']
+                    if not sprint_items:
+                        continue
+
                     created = history.created
                     author = 'Unknown'
-                if hasattr(history, 'author') and history.author is not None:
-                    author = getattr(history.author, 'displayName', 'Unknown')
+                    if getattr(history, 'author', None) is not None:
+                        author = getattr(history.author, 'displayName', 'Unknown')
 
-                    for item in history.items:
-                        if item.field == 'Sprint':
-                            from_sprint = item.fromString if item.fromString else None
-                            to_sprint = item.toString if item.toString else None
+                    for item in sprint_items:
+                        from_sprint = item.fromString if item.fromString else None
+                        to_sprint = item.toString if item.toString else None
 
-                            sprint_changes.append({
-                                'timestamp': created,
-                                'author': author,
-                                'from_sprint': from_sprint,
-                                'to_sprint': to_sprint
-                            })
+                        sprint_changes.append({
+                            'timestamp': created,
+                            'author': author,
+                            'from_sprint': from_sprint,
+                            'to_sprint': to_sprint
+                        })
 
             if not sprint_changes:
                 return [TextContent(type="text", text=f"**Sprint History for {issue_key}**\n\nNo sprint changes found in the issue history.")]
 
             # Format output
-            result_text = f"**Sprint History for {issue_key}**\n\n"
+            parts = [f"**Sprint History for {issue_key}**\n\n"]
 
             for i, change in enumerate(sprint_changes, 1):
                 timestamp = change['timestamp']
@@ -1492,25 +2112,23 @@ class JiraMCPServer:
                 else:
                     action = "Sprint changed (unknown)"
 
-                result_text += f"{i}. **{timestamp}** - {action}\n   By: {author}\n\n"
+                parts.append(f"{i}. **{timestamp}** - {action}\n   By: {author}\n\n")
 
-            return [TextContent(type="text", text=result_text)]
+            return [TextContent(type="text", text="".join(parts))]
 
         except Exception as e:
             return [TextContent(type="text", text=f"Error fetching sprint history for {issue_key}: {str(e)}")]
 
+    @staticmethod
+    def _truncate(text: str, width: int = 50) -> str:
+        """Shorten text to at most width characters, ending in '...' when cut"""
+        return text if len(text) <= width else text[:width - 3] + '...'
+
     @staticmethod
     def _categorize_status(status_name: str) -> str:
         """Categorize a status name into active, done, or backlog"""
-        lower = status_name.lower()
-        if lower in DONE_STATUSES:
-            return 'done'
-        if lower in ACTIVE_STATUSES:
-            return 'active'
-        if lower in BACKLOG_STATUSES:
-            return 'backlog'
         # Default: treat unknown statuses as active if they're not clearly backlog
-        return 'active'
+        return STATUS_CATEGORIES.get(status_name.lower(), 'active')
 
     @staticmethod
     def _extract_status_transitions(issue) -> list:
@@ -1518,21 +2136,26 @@ class JiraMCPServer:
 
         Returns a list of dicts with keys: timestamp, from_status, to_status, author
         """
+        histories = getattr(getattr(issue, 'changelog', None), 'histories', None)
+        if not histories:
+            return []
+
         transitions = []
-        if hasattr(issue, 'changelog') and hasattr(issue.changelog, 'histories'):
-            for history in issue.changelog.histories:
-                created = history.created
-                author = 'Unknown'
-                if hasattr(history, 'author') and history.author is not None:
-                    author = getattr(history.author, 'displayName', 'Unknown')
-                for item in history.items:
-                    if item.field == 'status':
-                        transitions.append({
-                            'timestamp': created,
-                            'from_status': item.fromString or '',
-                            'to_status': item.toString or '',
-                            'author': author
-                        })
+        for history in histories:
+            status_items = [item for item in history.items if item.field == 'status']
+            if not status_items:
+                continue
+            created = history.created
+            author = 'Unknown'
+            if getattr(history, 'author', None) is not None:
+                author = getattr(history.author, 'displayName', 'Unknown')
+            for item in status_items:
+                transitions.append({
+                    'timestamp': created,
+                    'from_status': item.fromString or '',
+                    'to_status': item.toString or '',
+                    'author': author
+                })
         return transitions
 
     @staticmethod
@@ -1540,38 +2163,35 @@ class JiraMCPServer:
         """Parse a Jira timestamp string into a datetime object"""
         # Jira timestamps look like: 2026-01-15T10:30:00.000+0000
         # or 2026-01-15T10:30:00.000+00:00
-        # Strip milliseconds and timezone for simplicity
-        ts_clean = ts.replace('T', ' ')
-        # Handle timezone offset
-        for sep in ['+', '-']:
-            # Find the timezone part (last + or - that's not in the date)
-            parts = ts_clean.rsplit(sep, 1)
-            if len(parts) == 2 and ':' in parts[1] and len(parts[1]) <= 6:
-                ts_clean = parts[0]
-                break
-        # Remove milliseconds
-        if '.' in ts_clean:
-            ts_clean = ts_clean.split('.')[0]
-        return datetime.strptime(ts_clean, '%Y-%m-%d %H:%M:%S')
+        # Milliseconds and timezone are ignored for simplicity. The fields sit
+        # at fixed positions, so slice them out rather than using strptime
+        try:
+            return datetime(int(ts[0:4]), int(ts[5:7]), int(ts[8:10]),
+                            int(ts[11:13]), int(ts[14:16]), int(ts[17:19]))
+        except (ValueError, IndexError):
+            pass
+
+        match = JIRA_TIMESTAMP_RE.match(ts)
+        if not match:
+            raise ValueError(f"Unrecognized Jira timestamp: {ts!r}")
+        return datetime(*map(int, match.groups()))
 
     @staticmethod
     def _count_business_days(start: datetime, end: datetime) -> float:
         """Count business days between two datetimes"""
         if end <= start:
             return 0.0
-        # Count full days
-        current = start.date()
-        end_date = end.date()
-        business_days = 0
-        while current <= end_date:
-            if current.weekday() < 5:  # Monday=0 to Friday=4
-                business_days += 1
-            current += timedelta(days=1)
-        # Subtract partial first and last day
         # If start and end are same day, return fraction of that day
         if start.date() == end.date():
             hours = (end - start).total_seconds() / 3600
             return round(hours / 24, 1) if start.weekday() < 5 else 0.0
+        # Count weekdays from the start date to the end date inclusive:
+        # five per full week, plus the weekdays in the remaining partial week
+        days = (end.date() - start.date()).days + 1
+        full_weeks, remainder = divmod(days, 7)
+        start_weekday = start.weekday()  # Monday=0 to Friday=4
+        business_days = full_weeks * 5 + sum(
+            1 for i in range(remainder) if (start_weekday + i) % 7 < 5)
         return float(business_days)
 
     @staticmethod
@@ -1605,31 +2225,32 @@ class JiraMCPServer:
 
         first_active_ts = None
         last_done_ts = None
+        start_dt = None
+        end_dt = None
 
-        # Find first transition to an active status
-        for t in transitions:
-            cat = self._categorize_status(t['to_status'])
-            if cat == 'active':
-                first_active_ts = t['timestamp']
-                break
+        # Parse each transition timestamp once up front
+        parsed = [self._parse_jira_timestamp(t['timestamp']) for t in transitions]
 
-        # Find last transition to a done status
-        for t in reversed(transitions):
+        # Find the first transition to an active status and the last
+        # transition to a done status in one pass
+        for t, t_dt in zip(transitions, parsed):
             cat = self._categorize_status(t['to_status'])
-            if cat == 'done':
+            if cat == 'active':
+                if first_active_ts is None:
+                    first_active_ts = t['timestamp']
+                    start_dt = t_dt
+            elif cat == 'done':
                 last_done_ts = t['timestamp']
-                break
+                end_dt = t_dt
 
         # Fallback: if no active transition found, use creation date
         if not first_active_ts and last_done_ts:
             first_active_ts = created_date
+            start_dt = self._parse_jira_timestamp(created_date)
 
         if not first_active_ts or not last_done_ts:
             return {'complete': False, 'cycle_time_seconds': 0}
 
-        start_dt = self._parse_jira_timestamp(first_active_ts)
-        end_dt = self._parse_jira_timestamp(last_done_ts)
-
         if end_dt <= start_dt:
             return {'complete': False, 'cycle_time_seconds': 0}
 
@@ -1638,20 +2259,20 @@ class JiraMCPServer:
         business_days = self._count_business_days(start_dt, end_dt)
 
         # Calculate time in each status
-        time_in_status = {}
+        time_in_status = defaultdict(float)
         # Build timeline: start from first_active through all transitions
         prev_status = None
         prev_ts = None
-        for t in transitions:
-            t_dt = self._parse_jira_timestamp(t['timestamp'])
+        for t, t_dt in zip(transitions, parsed):
             if t_dt < start_dt:
+                # Time before the cycle started doesn't count, so clamp to its start
                 prev_status = t['to_status']
-                prev_ts = t_dt
+                prev_ts = start_dt
                 continue
             if prev_status and prev_ts:
-                elapsed = (t_dt - max(prev_ts, start_dt)).total_seconds()
+                elapsed = (t_dt - prev_ts).total_seconds()
                 if elapsed > 0:
-                    time_in_status[prev_status] = time_in_status.get(prev_status, 0) + elapsed
+                    time_in_status[prev_status] += elapsed
             prev_status = t['to_status']
             prev_ts = t_dt
             if t_dt >= end_dt:
@@ -1664,10 +2285,10 @@ class JiraMCPServer:
             'business_days': business_days,
             'first_active': first_active_ts,
             'last_done': last_done_ts,
-            'time_in_status': time_in_status,
+            'time_in_status': dict(time_in_status),
         }
 
-    async def _analyze_sprint_scope(self, sprint_name: str, board_id: Optional[int] = None) -> List[TextContent]:
+    def _analyze_sprint_scope(self, sprint_name: str, board_id: Optional[int] = None) -> List[TextContent]:
         """Analyze a sprint using the sprint report API to identify planned vs added issues, punted issues, and calculate predictability"""
         try:
             if not self.jira_client:
@@ -1679,29 +2300,13 @@ class JiraMCPServer:
             if board_id:
                 # Use provided board ID (paginated)
                 try:
-                    sprints = self._get_all_sprints(board_id)
-                    for sprint in sprints:
-                        if sprint.name == sprint_name:
-                            target_sprint = sprint
-                            break
+                    target_sprint = self._find_sprint_on_board(board_id, sprint_name)
                 except Exception as e:
                     return [TextContent(type="text", text=f"Error fetching sprints from board {board_id}: {str(e)}")]
             else:
                 # Try to find the sprint across all boards
                 try:
-                    boards = self._get_all_boards()
-                    for board in boards:
-                        try:
-                            sprints = self._get_all_sprints(board.id)
-                            for sprint in sprints:
-                                if sprint.name == sprint_name:
-                                    target_sprint = sprint
-                                    board_id = board.id
-                                    break
-                            if target_sprint:
-                                break
-                        except:
-                            continue
+                    target_sprint, board_id = self._find_sprint_on_boards(sprint_name)
                 except Exception as e:
                     return [TextContent(type="text", text=f"Error searching for sprint: {str(e)}")]
 
@@ -1722,7 +2327,7 @@ class JiraMCPServer:
             try:
                 response = self.jira_client._session.get(report_url)
                 response.raise_for_status()
-                report = response.json()
+                report = json_loads(response.content)
             except Exception as e:
                 return [TextContent(type="text", text=f"Error fetching sprint report: {str(e)}")]
 
@@ -1740,9 +2345,7 @@ class JiraMCPServer:
             def get_issue_info(issue_data):
                 """Extract issue info from sprint report issue data"""
                 key = issue_data.get('key', '')
-                summary = issue_data.get('summary', '')
-                if len(summary) > 60:
-                    summary = summary[:57] + '...'
+                summary = self._truncate(issue_data.get('summary', ''), 60)
                 sp = get_sp(issue_data)
                 status = issue_data.get('status', {}).get('name', '')
                 is_added = key in added_keys
@@ -1754,31 +2357,37 @@ class JiraMCPServer:
                     'is_added': is_added,
                 }
 
-            # Categorize issues from the report
-            completed_issues = [get_issue_info(i) for i in contents.get('completedIssues', [])]
-            not_completed_issues = [get_issue_info(i) for i in contents.get('issuesNotCompletedInCurrentSprint', [])]
-            punted_issues = [get_issue_info(i) for i in contents.get('puntedIssues', [])]
-            completed_elsewhere = [get_issue_info(i) for i in contents.get('issuesCompletedInAnotherSprint', [])]
-
-            # Split each category into planned vs added
-            completed_planned = [i for i in completed_issues if not i['is_added']]
-            completed_added = [i for i in completed_issues if i['is_added']]
-            not_completed_planned = [i for i in not_completed_issues if not i['is_added']]
-            not_completed_added = [i for i in not_completed_issues if i['is_added']]
-            punted_planned = [i for i in punted_issues if not i['is_added']]
-            punted_added = [i for i in punted_issues if i['is_added']]
-            elsewhere_planned = [i for i in completed_elsewhere if not i['is_added']]
-            elsewhere_added = [i for i in completed_elsewhere if i['is_added']]
-
-            # Calculate SP totals
-            completed_planned_sp = sum(i['sp'] for i in completed_planned)
-            completed_added_sp = sum(i['sp'] for i in completed_added)
-            not_completed_planned_sp = sum(i['sp'] for i in not_completed_planned)
-            not_completed_added_sp = sum(i['sp'] for i in not_completed_added)
-            punted_planned_sp = sum(i['sp'] for i in punted_planned)
-            punted_added_sp = sum(i['sp'] for i in punted_added)
-            elsewhere_planned_sp = sum(i['sp'] for i in elsewhere_planned)
-            elsewhere_added_sp = sum(i['sp'] for i in elsewhere_added)
+            # Categorize issues from the report, splitting each category into
+            # planned vs added and totalling story points in a single pass
+            issues_by_bucket = {}
+            sp_by_bucket = {}
+            for category, report_key in (('completed', 'completedIssues'),
+                                         ('not_completed', 'issuesNotCompletedInCurrentSprint'),
+                                         ('punted', 'puntedIssues'),
+                                         ('elsewhere', 'issuesCompletedInAnotherSprint')):
+                for issue_data in contents.get(report_key, []):
+                    info = get_issue_info(issue_data)
+                    bucket = (category, info['is_added'])
+                    issues_by_bucket.setdefault(bucket, []).append(info)
+                    sp_by_bucket[bucket] = sp_by_bucket.get(bucket, 0) + info['sp']
+
+            completed_planned = issues_by_bucket.get(('completed', False), [])
+            completed_added = issues_by_bucket.get(('completed', True), [])
+            not_completed_planned = issues_by_bucket.get(('not_completed', False), [])
+            not_completed_added = issues_by_bucket.get(('not_completed', True), [])
+            punted_planned = issues_by_bucket.get(('punted', False), [])
+            punted_added = issues_by_bucket.get(('punted', True), [])
+            elsewhere_planned = issues_by_bucket.get(('elsewhere', False), [])
+            elsewhere_added = issues_by_bucket.get(('elsewhere', True), [])
+
+            completed_planned_sp = sp_by_bucket.get(('completed', False), 0)
+            completed_added_sp = sp_by_bucket.get(('completed', True), 0)
+            not_completed_planned_sp = sp_by_bucket.get(('not_completed', False), 0)
+            not_completed_added_sp = sp_by_bucket.get(('not_completed', True), 0)
+            punted_planned_sp = sp_by_bucket.get(('punted', False), 0)
+            punted_added_sp = sp_by_bucket.get(('punted', True), 0)
+            elsewhere_planned_sp = sp_by_bucket.get(('elsewhere', False), 0)
+            elsewhere_added_sp = sp_by_bucket.get(('elsewhere', True), 0)
 
             total_planned_sp = completed_planned_sp + not_completed_planned_sp + punted_planned_sp + elsewhere_planned_sp
             total_added_sp = completed_added_sp + not_completed_added_sp + punted_added_sp + elsewhere_added_sp
@@ -1799,66 +2408,65 @@ class JiraMCPServer:
             sprint_start_str = str(sprint_start)[:10] if sprint_start else 'Unknown'
             sprint_end_str = str(sprint_end)[:10] if sprint_end else 'Unknown'
 
-            result_text = f"**Sprint Scope Analysis: {sprint_name}**\n\n"
-            result_text += f"**Sprint Start:** {sprint_start_str}\n"
-            result_text += f"**Sprint End:** {sprint_end_str}\n"
-            result_text += f"**State:** {sprint_state}\n\n"
+            parts = [f"**Sprint Scope Analysis: {sprint_name}**\n\n"]
+            parts.append(f"**Sprint Start:** {sprint_start_str}\n")
+            parts.append(f"**Sprint End:** {sprint_end_str}\n")
+            parts.append(f"**State:** {sprint_state}\n\n")
 
-            result_text += f"**Predictability: {predictability:.1f}%**\n"
-            result_text += f"Formula: Completed Planned SP ({done_planned_sp}) / (All Committed SP ({total_planned_sp}) + All Added SP ({total_added_sp}))\n\n"
+            parts.append(f"**Predictability: {predictability:.1f}%**\n")
+            parts.append(f"Formula: Completed Planned SP ({done_planned_sp}) / (All Committed SP ({total_planned_sp}) + All Added SP ({total_added_sp}))\n\n")
 
-            result_text += f"**Planned Issues ({len(all_planned)}):** {total_planned_sp} SP (committed at sprint start)\n"
-            result_text += f"  - Completed: {completed_planned_sp} SP ({len(completed_planned)} issues)\n"
-            result_text += f"  - Not Completed: {not_completed_planned_sp} SP ({len(not_completed_planned)} issues)\n"
-            result_text += f"  - Punted/Removed: {punted_planned_sp} SP ({len(punted_planned)} issues)\n"
+            parts.append(f"**Planned Issues ({len(all_planned)}):** {total_planned_sp} SP (committed at sprint start)\n")
+            parts.append(f"  - Completed: {completed_planned_sp} SP ({len(completed_planned)} issues)\n")
+            parts.append(f"  - Not Completed: {not_completed_planned_sp} SP ({len(not_completed_planned)} issues)\n")
+            parts.append(f"  - Punted/Removed: {punted_planned_sp} SP ({len(punted_planned)} issues)\n")
             if elsewhere_planned:
-                result_text += f"  - Completed in Another Sprint: {elsewhere_planned_sp} SP ({len(elsewhere_planned)} issues)\n"
-            result_text += "\n"
+                parts.append(f"  - Completed in Another Sprint: {elsewhere_planned_sp} SP ({len(elsewhere_planned)} issues)\n")
+            parts.append("\n")
 
-            result_text += f"**Added Mid-Sprint ({len(all_added)}):** {total_added_sp} SP (scope creep)\n"
-            result_text += f"  - Completed: {completed_added_sp} SP ({len(completed_added)} issues)\n"
-            result_text += f"  - Not Completed: {not_completed_added_sp} SP ({len(not_completed_added)} issues)\n"
+            parts.append(f"**Added Mid-Sprint ({len(all_added)}):** {total_added_sp} SP (scope creep)\n")
+            parts.append(f"  - Completed: {completed_added_sp} SP ({len(completed_added)} issues)\n")
+            parts.append(f"  - Not Completed: {not_completed_added_sp} SP ({len(not_completed_added)} issues)\n")
             if punted_added:
-                result_text += f"  - Punted/Removed: {punted_added_sp} SP ({len(punted_added)} issues)\n"
+                parts.append(f"  - Punted/Removed: {punted_added_sp} SP ({len(punted_added)} issues)\n")
             if elsewhere_added:
-                result_text += f"  - Completed in Another Sprint: {elsewhere_added_sp} SP ({len(elsewhere_added)} issues)\n"
-            result_text += "\n"
+                parts.append(f"  - Completed in Another Sprint: {elsewhere_added_sp} SP ({len(elsewhere_added)} issues)\n")
+            parts.append("\n")
 
             # Punted issues table
             all_punted = punted_planned + punted_added
             if all_punted:
-                result_text += "**Punted Issues:**\n\n"
-                result_text += "| Issue | SP | Summary |\n"
-                result_text += "|-------|----|---------|\n"
-                for issue_info in all_punted:
-                    sp = issue_info['sp'] if issue_info['sp'] else '-'
-                    result_text += f"| {issue_info['key']} | {sp} | {issue_info['summary']} |\n"
-                result_text += "\n"
+                parts.append("**Punted Issues:**\n\n"
+                             "| Issue | SP | Summary |\n"
+                             "|-------|----|---------|\n")
+                parts.extend(f"| {i['key']} | {i['sp'] or '-'} | {i['summary']} |\n" for i in all_punted)
+                parts.append("\n")
 
             # Added mid-sprint issues table
             if all_added:
-                result_text += "**Added Mid-Sprint Issues:**\n\n"
-                result_text += "| Issue | SP | Status | Summary |\n"
-                result_text += "|-------|----|---------|---------|\n"
-                for issue_info in all_added:
-                    sp = issue_info['sp'] if issue_info['sp'] else '-'
-                    result_text += f"| {issue_info['key']} | {sp} | {issue_info['status']} | {issue_info['summary']} |\n"
-                result_text += "\n"
+                parts.append("**Added Mid-Sprint Issues:**\n\n"
+                             "| Issue | SP | Status | Summary |\n"
+                             "|-------|----|---------|---------|\n")
+                parts.extend(f"| {i['key']} | {i['sp'] or '-'} | {i['status']} | {i['summary']} |\n"
+                             for i in all_added)
+                parts.append("\n")
 
-            return [TextContent(type="text", text=result_text)]
+            return [TextContent(type="text", text="".join(parts))]
 
         except Exception as e:
             return [TextContent(type="text", text=f"Error analyzing sprint scope: {str(e)}")]
 
-    async def _get_issue_cycle_time(self, issue_key: str) -> List[TextContent]:
+    def _get_issue_cycle_time(self, issue_key: str) -> List[TextContent]:
         """Get cycle time and status transition timeline for a single issue"""
         try:
             if not self.jira_client:
                 return [TextContent(type="text", text="Jira client not initialized")]
 
             # Fetch issue with changelog
-            issue = self.jira_client.issue(issue_key, expand='changelog')
-            created_date = str(issue.fields.created)
+            issue = self._fetch_issue(issue_key, expand='changelog')
+            fields = issue.fields
+            created_date = str(fields.created)
+            current_status = fields.status.name
 
             transitions = self._extract_status_transitions(issue)
 
@@ -1866,105 +2474,80 @@ class JiraMCPServer:
                 return [TextContent(type="text",
                     text=f"**Cycle Time for {issue_key}**\n\n"
                          f"No status transitions found in the issue history.\n"
-                         f"Current status: {issue.fields.status.name}")]
+                         f"Current status: {current_status}")]
 
             cycle_data = self._calculate_cycle_time(transitions, created_date)
 
             # Format output
-            result_text = f"**Cycle Time for {issue_key}**\n\n"
-            result_text += f"**Summary:** {issue.fields.summary}\n"
-            result_text += f"**Type:** {issue.fields.issuetype.name}\n"
-            result_text += f"**Current Status:** {issue.fields.status.name}\n\n"
+            parts = [f"**Cycle Time for {issue_key}**\n\n"]
+            parts.append(f"**Summary:** {fields.summary}\n")
+            parts.append(f"**Type:** {fields.issuetype.name}\n")
+            parts.append(f"**Current Status:** {current_status}\n\n")
 
             if cycle_data['complete']:
-                result_text += f"**Cycle Time:** {self._format_duration(cycle_data['cycle_time_seconds'])}\n"
-                result_text += f"**Calendar Days:** {cycle_data['calendar_days']}\n"
-                result_text += f"**Business Days:** {cycle_data['business_days']}\n"
-                result_text += f"**Started:** {cycle_data['first_active']}\n"
-                result_text += f"**Completed:** {cycle_data['last_done']}\n\n"
+                parts.append(f"**Cycle Time:** {self._format_duration(cycle_data['cycle_time_seconds'])}\n")
+                parts.append(f"**Calendar Days:** {cycle_data['calendar_days']}\n")
+                parts.append(f"**Business Days:** {cycle_data['business_days']}\n")
+                parts.append(f"**Started:** {cycle_data['first_active']}\n")
+                parts.append(f"**Completed:** {cycle_data['last_done']}\n\n")
 
                 # Time in each status
                 time_in_status = cycle_data.get('time_in_status', {})
                 if time_in_status:
-                    result_text += "**Time in Each Status:**\n\n"
-                    result_text += "| Status | Time | Category |\n"
-                    result_text += "|--------|------|----------|\n"
+                    parts.append("**Time in Each Status:**\n\n")
+                    parts.append("| Status | Time | Category |\n")
+                    parts.append("|--------|------|----------|\n")
                     # Sort by time spent descending
                     sorted_statuses = sorted(time_in_status.items(), key=lambda x: x[1], reverse=True)
                     for status_name, seconds in sorted_statuses:
                         category = self._categorize_status(status_name)
-                        result_text += f"| {status_name} | {self._format_duration(seconds)} | {category} |\n"
-                    result_text += "\n"
+                        parts.append(f"| {status_name} | {self._format_duration(seconds)} | {category} |\n")
+                    parts.append("\n")
             else:
-                result_text += "**Cycle Time:** Not completed (issue has not reached a done status)\n\n"
+                parts.append("**Cycle Time:** Not completed (issue has not reached a done status)\n\n")
 
             # Full transition timeline
-            result_text += "**Status Transition Timeline:**\n\n"
+            parts.append("**Status Transition Timeline:**\n\n")
             for i, t in enumerate(transitions, 1):
-                result_text += f"{i}. **{t['timestamp']}** - {t['from_status']} -> {t['to_status']}\n"
-                result_text += f"   By: {t['author']}\n\n"
+                parts.append(f"{i}. **{t['timestamp']}** - {t['from_status']} -> {t['to_status']}\n")
+                parts.append(f"   By: {t['author']}\n\n")
 
-            return [TextContent(type="text", text=result_text)]
+            return [TextContent(type="text", text="".join(parts))]
 
         except Exception as e:
             return [TextContent(type="text", text=f"Error fetching cycle time for {issue_key}: {str(e)}")]
 
     def _get_story_points(self, issue) -> float:
         """Extract story points from an issue object."""
-        all_fields = self.jira_client.fields()
-        story_point_field = None
-        for field in all_fields:
-            if field.get('name', '').lower() in ['story points', 'story point estimate']:
-                story_point_field = field['id']
-                break
-        if not story_point_field:
-            for candidate in ['customfield_10016', 'customfield_10026', 'customfield_10004']:
-                if hasattr(issue.fields, candidate):
-                    story_point_field = candidate
-                    break
-        if story_point_field and hasattr(issue.fields, story_point_field):
-            sp = getattr(issue.fields, story_point_field)
-            if sp is not None:
-                return float(sp)
+        story_point_field = self.story_points_field_id or self._first_present_field(
+            issue, STORY_POINTS_FIELD_CANDIDATES)
+        sp = getattr(issue.fields, story_point_field, None) if story_point_field else None
+        if sp is not None:
+            return float(sp)
         return 0
 
     def _find_assigned_team_field(self) -> Optional[str]:
         """Find the custom field ID for AssignedTeam."""
-        all_fields = self.jira_client.fields()
-        for field in all_fields:
-            field_name = field.get('name', '')
-            field_clauseNames = field.get('clauseNames', [])
-            if field_name == 'Assigned Team' or 'AssignedTeam' in field_clauseNames:
-                return field['id']
-        for field in all_fields:
-            field_name_lower = field.get('name', '').lower()
-            field_id_lower = field.get('id', '').lower()
-            if 'assignedteam' in field_id_lower or 'assigned_team' in field_name_lower or 'assigned team' in field_name_lower:
-                return field['id']
-        return None
+        self._get_fields()
+        return self._assigned_team_field_id
 
-    def _fetch_issues_by_date_range(self, start_date: str, end_date: str,
-                                     team: Optional[str] = None) -> list:
-        """Fetch closed issues in a date range using JQL. Returns issue objects with changelog."""
+    def _iter_issues_by_date_range(self, start_date: str, end_date: str,
+                                    team: Optional[str] = None):
+        """Fetch closed issues in a date range using JQL. Yields pages of issue objects with changelog."""
         jql = f'status = Closed AND resolved >= "{start_date}" AND resolved < "{end_date}"'
         if team:
             jql += f' AND AssignedTeam = "{team}"'
         jql += ' ORDER BY resolved ASC'
 
-        issues = []
-        start_at = 0
-        max_results = 50
-        while True:
-            batch = self.jira_client.search_issues(
-                jql, startAt=start_at, maxResults=max_results, expand='changelog'
-            )
-            if not batch:
-                break
-            issues.extend(batch)
-            if len(batch) < max_results:
-                break
-            start_at += len(batch)
-        return issues
+        # Only request the fields the cycle time analysis reads
+        self._get_fields()
+        if self._story_points_field_id:
+            story_point_fields = [self._story_points_field_id]
+        else:
+            story_point_fields = list(STORY_POINTS_FIELD_CANDIDATES)
+        fields = ','.join(['summary', 'status', 'issuetype', 'created', 'resolutiondate'] + story_point_fields)
+
+        return self._iter_search_pages(jql, fields=fields, expand='changelog')
 
     def _fetch_issues_by_sprint(self, sprint_name: str,
                                  board_id: Optional[int] = None) -> tuple:
@@ -1972,25 +2555,9 @@ class JiraMCPServer:
         target_sprint = None
 
         if board_id:
-            sprints = self._get_all_sprints(board_id)
-            for sprint in sprints:
-                if sprint.name == sprint_name:
-                    target_sprint = sprint
-                    break
+            target_sprint = self._find_sprint_on_board(board_id, sprint_name)
         else:
-            boards = self._get_all_boards()
-            for board in boards:
-                try:
-                    sprints = self._get_all_sprints(board.id)
-                    for sprint in sprints:
-                        if sprint.name == sprint_name:
-                            target_sprint = sprint
-                            board_id = board.id
-                            break
-                    if target_sprint:
-                        break
-                except:
-                    continue
+            target_sprint, board_id = self._find_sprint_on_boards(sprint_name)
 
         if not target_sprint:
             raise ValueError(f"Sprint '{sprint_name}' not found")
@@ -1998,13 +2565,13 @@ class JiraMCPServer:
         report_url = f"{self.jira_client.server_url}/rest/greenhopper/1.0/rapid/charts/sprintreport?rapidViewId={board_id}&sprintId={target_sprint.id}"
         response = self.jira_client._session.get(report_url)
         response.raise_for_status()
-        report = response.json()
+        report = json_loads(response.content)
 
         contents = report.get('contents', {})
         completed_issues_data = contents.get('completedIssues', [])
         return completed_issues_data, target_sprint
 
-    async def _analyze_cycle_time(self, start_date: Optional[str] = None,
+    def _analyze_cycle_time(self, start_date: Optional[str] = None,
                                    end_date: Optional[str] = None,
                                    team: Optional[str] = None,
                                    sprint_name: Optional[str] = None,
@@ -2038,13 +2605,13 @@ class JiraMCPServer:
 
             if use_date_range:
                 # Date range mode: JQL search (team filter applied in JQL)
-                issues = self._fetch_issues_by_date_range(start_date, end_date, team)
-                if not issues:
-                    return [TextContent(type="text",
-                        text=f"**Cycle Time Analysis: {title}**\n\nNo closed issues found in this date range.")]
-
-                for issue in issues:
-                    created_date = str(issue.fields.created)
+                # Issues arrive a page at a time; only the small per-issue result is
+                # kept, so each page and its changelogs are freed once processed
+                issue_count = 0
+                for issue in itertools.chain.from_iterable(
+                        self._iter_issues_by_date_range(start_date, end_date, team)):
+                    issue_count += 1
+                    created_date = issue.fields.created
                     transitions = self._extract_status_transitions(issue)
                     if not transitions:
                         skipped_no_transitions += 1
@@ -2056,9 +2623,7 @@ class JiraMCPServer:
                         continue
 
                     sp = self._get_story_points(issue)
-                    summary = str(issue.fields.summary or '')
-                    if len(summary) > 50:
-                        summary = summary[:47] + '...'
+                    summary = self._truncate(issue.fields.summary or '')
 
                     cycle_results.append({
                         'key': issue.key,
@@ -2071,6 +2636,10 @@ class JiraMCPServer:
                         'time_in_status': cycle_data.get('time_in_status', {}),
                     })
 
+                if not issue_count:
+                    return [TextContent(type="text",
+                        text=f"**Cycle Time Analysis: {title}**\n\nNo closed issues found in this date range.")]
+
                 sprint_info_text = f"**Period:** {start_date} to {end_date}\n"
 
             else:
@@ -2090,21 +2659,27 @@ class JiraMCPServer:
                 # Find team field for filtering
                 assigned_team_field = self._find_assigned_team_field() if team else None
 
+                # Fetch all completed issues with their changelogs in batched searches
+                fields = 'summary,issuetype,created'
+                if assigned_team_field:
+                    fields += f',{assigned_team_field}'
+                issues_by_key = self._fetch_issues_with_changelog(
+                    [d['key'] for d in completed_issues_data if d.get('key')], fields=fields)
+
                 for issue_data in completed_issues_data:
                     issue_key = issue_data.get('key', '')
-                    if not issue_key:
-                        continue
-
-                    try:
-                        issue = self.jira_client.issue(issue_key, expand='changelog')
-                    except Exception:
+                    # Pop so the issue and its changelog are released after this pass
+                    issue = issues_by_key.pop(issue_key, None)
+                    if issue is None:
                         continue
 
                     # Apply team filter
                     if team and assigned_team_field:
                         issue_team = getattr(issue.fields, assigned_team_field, None)
                         if issue_team:
-                            team_name = issue_team.value if hasattr(issue_team, 'value') else str(issue_team)
+                            team_name = getattr(issue_team, 'value', _MISSING)
+                            if team_name is _MISSING:
+                                team_name = str(issue_team)
                             if team_name != team:
                                 skipped_team_filter += 1
                                 continue
@@ -2112,7 +2687,7 @@ class JiraMCPServer:
                             skipped_team_filter += 1
                             continue
 
-                    created_date = str(issue.fields.created)
+                    created_date = issue.fields.created
                     transitions = self._extract_status_transitions(issue)
                     if not transitions:
                         skipped_no_transitions += 1
@@ -2128,9 +2703,7 @@ class JiraMCPServer:
                     val = stat.get('statFieldValue', {})
                     sp = val.get('value', 0) or 0
 
-                    summary = issue_data.get('summary', issue.fields.summary or '')
-                    if len(summary) > 50:
-                        summary = summary[:47] + '...'
+                    summary = self._truncate(issue_data.get('summary', issue.fields.summary or ''))
 
                     cycle_results.append({
                         'key': issue_key,
@@ -2164,7 +2737,8 @@ class JiraMCPServer:
 
             median_days = round(statistics.median(cycle_days_list), 1)
             avg_days = round(statistics.mean(cycle_days_list), 1)
-            p85_days = round(sorted(cycle_days_list)[int(len(cycle_days_list) * 0.85)], 1) if len(cycle_days_list) > 1 else cycle_days_list[0]
+            # Interpolated 85th percentile (the 17th of 19 cut points at 5% steps)
+            p85_days = round(statistics.quantiles(cycle_days_list, n=20, method='inclusive')[16], 1) if len(cycle_days_list) > 1 else cycle_days_list[0]
             median_bdays = round(statistics.median(business_days_list), 1)
 
             # Sort by cycle time descending
@@ -2172,70 +2746,68 @@ class JiraMCPServer:
 
             # Identify outliers (> 2x median)
             outlier_threshold = median_days * 2
-            outliers = [r for r in cycle_results if r['cycle_days'] > outlier_threshold]
+            is_outlier = [r['cycle_days'] > outlier_threshold for r in cycle_results]
+            outliers = [r for r, flagged in zip(cycle_results, is_outlier) if flagged]
 
             # Breakdown by issue type
-            type_stats = {}
+            type_stats = defaultdict(list)
             for r in cycle_results:
-                t = r['type']
-                if t not in type_stats:
-                    type_stats[t] = []
-                type_stats[t].append(r['cycle_days'])
+                type_stats[r['type']].append(r['cycle_days'])
 
             # Format output
-            result_text = f"**Cycle Time Analysis: {title}**\n\n"
-            result_text += sprint_info_text
-            result_text += f"**Completed Issues Analyzed:** {len(cycle_results)}\n"
+            parts = [f"**Cycle Time Analysis: {title}**\n\n"]
+            parts.append(sprint_info_text)
+            parts.append(f"**Completed Issues Analyzed:** {len(cycle_results)}\n")
             if team:
-                result_text += f"**Team Filter:** {team}\n"
+                parts.append(f"**Team Filter:** {team}\n")
             if skipped_no_transitions:
-                result_text += f"**Skipped (no transitions):** {skipped_no_transitions}\n"
+                parts.append(f"**Skipped (no transitions):** {skipped_no_transitions}\n")
             if skipped_team_filter:
-                result_text += f"**Filtered out (team):** {skipped_team_filter}\n"
-            result_text += "\n"
+                parts.append(f"**Filtered out (team):** {skipped_team_filter}\n")
+            parts.append("\n")
 
-            result_text += "**Cycle Time Statistics (calendar days):**\n"
-            result_text += f"  - Median: **{median_days} days**\n"
-            result_text += f"  - Average: {avg_days} days\n"
-            result_text += f"  - 85th Percentile: {p85_days} days\n"
-            result_text += f"  - Median (business days): {median_bdays} days\n\n"
+            parts.append("**Cycle Time Statistics (calendar days):**\n")
+            parts.append(f"  - Median: **{median_days} days**\n")
+            parts.append(f"  - Average: {avg_days} days\n")
+            parts.append(f"  - 85th Percentile: {p85_days} days\n")
+            parts.append(f"  - Median (business days): {median_bdays} days\n\n")
 
             # Breakdown by type
             if len(type_stats) > 1:
-                result_text += "**Breakdown by Issue Type:**\n\n"
-                result_text += "| Type | Count | Median | Average |\n"
-                result_text += "|------|-------|--------|---------|\n"
+                parts.append("**Breakdown by Issue Type:**\n\n")
+                parts.append("| Type | Count | Median | Average |\n")
+                parts.append("|------|-------|--------|---------|\n")
                 for itype, days_list in sorted(type_stats.items()):
                     count = len(days_list)
                     t_median = round(statistics.median(days_list), 1)
                     t_avg = round(statistics.mean(days_list), 1)
-                    result_text += f"| {itype} | {count} | {t_median}d | {t_avg}d |\n"
-                result_text += "\n"
+                    parts.append(f"| {itype} | {count} | {t_median}d | {t_avg}d |\n")
+                parts.append("\n")
 
             # Per-issue table
-            result_text += "**Per-Issue Cycle Times:**\n\n"
-            result_text += "| Issue | Type | SP | Cycle (cal) | Cycle (biz) | Summary |\n"
-            result_text += "|-------|------|----|-------------|-------------|---------|\n"
-            for r in cycle_results:
+            parts.append("**Per-Issue Cycle Times:**\n\n")
+            parts.append("| Issue | Type | SP | Cycle (cal) | Cycle (biz) | Summary |\n")
+            parts.append("|-------|------|----|-------------|-------------|---------|\n")
+            for r, flagged in zip(cycle_results, is_outlier):
                 sp = r['sp'] if r['sp'] else '-'
-                flag = " **" if r['cycle_days'] > outlier_threshold else ""
-                flag_end = "**" if flag else ""
-                result_text += f"| {r['key']} | {r['type']} | {sp} | {flag}{r['cycle_days']}d{flag_end} | {r['business_days']}d | {r['summary']} |\n"
-            result_text += "\n"
+                flag = " **" if flagged else ""
+                flag_end = "**" if flagged else ""
+                parts.append(f"| {r['key']} | {r['type']} | {sp} | {flag}{r['cycle_days']}d{flag_end} | {r['business_days']}d | {r['summary']} |\n")
+            parts.append("\n")
 
             # Outliers section
             if outliers:
-                result_text += f"**Outliers (>{outlier_threshold} days, >2x median):**\n\n"
+                parts.append(f"**Outliers (>{outlier_threshold} days, >2x median):**\n\n")
                 for r in outliers:
-                    result_text += f"- **{r['key']}** ({r['cycle_days']} days): {r['summary']}\n"
+                    parts.append(f"- **{r['key']}** ({r['cycle_days']} days): {r['summary']}\n")
                     tis = r.get('time_in_status', {})
                     if tis:
-                        sorted_tis = sorted(tis.items(), key=lambda x: x[1], reverse=True)
-                        status_parts = [f"{name}: {self._format_duration(secs)}" for name, secs in sorted_tis[:3]]
-                        result_text += f"  Top statuses: {', '.join(status_parts)}\n"
-                result_text += "\n"
+                        top_tis = heapq.nlargest(3, tis.items(), key=lambda x: x[1])
+                        status_parts = [f"{name}: {self._format_duration(secs)}" for name, secs in top_tis]
+                        parts.append(f"  Top statuses: {', '.join(status_parts)}\n")
+                parts.append("\n")
 
-            return [TextContent(type="text", text=result_text)]
+            return [TextContent(type="text", text="".join(parts))]
 
         except Exception as e:
             return [TextContent(type="text", text=f"Error analyzing cycle time: {str(e)}")]